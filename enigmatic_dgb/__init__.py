@@ -1,122 +1,94 @@
 """Enigmatic DigiByte protocol package."""
 
-from .handshake import (
-    HandshakeParameters,
-    HandshakePhase,
-    HandshakeRole,
-    HandshakeState,
-    create_handshake_init_message,
-    create_handshake_resp_message,
-    create_initiator_state,
-    create_responder_state,
-    derive_session_key,
-    initiator_build_init_message,
-    initiator_process_resp,
-    responder_process_init_and_build_resp,
-)
-from .model import EnigmaticMessage, EncodingConfig
-from .dtsp import (
-    DTSPEncodingError,
-    DTSP_ALPHABET,
-    DTSP_CONTROL,
-    DTSP_DIGITS,
-    DTSP_LETTERS,
-    DTSP_SPECIALS,
-    DTSP_TOLERANCE,
-    closest_dtsp_symbol,
-    decode_dtsp_sequence_to_message,
-    encode_handshake_accept,
-    encode_handshake_end,
-    encode_handshake_start,
-    encode_message_to_dtsp_sequence,
-    format_dtsp_table,
-)
-from .binary_packets import (
-    BinaryEncodingError,
-    BinaryUTXOPacket,
-    decode_binary_packets_to_text,
-    encode_text_to_binary_packets,
-    format_packets_human_readable,
-)
-from .ordinals import (
-    ENIG_TAPROOT_MAGIC,
-    ENIG_TAPROOT_PROTOCOL,
-    ENIG_TAPROOT_VERSION_V1,
-    InscriptionMetadata,
-    InscriptionPayload,
-    OrdinalIndexer,
-    OrdinalInscriptionDecoder,
-    OrdinalInscriptionPlanner,
-    OrdinalLocation,
-    OrdinalScanConfig,
-    TaprootScriptView,
-    decode_enig_taproot_payload,
-    encode_enig_taproot_payload,
-    inspect_output_for_taproot,
-)
-from .unspendable import (
-    b58_dcmap,
-    b58_digits,
-    base58_check_encode,
-    base58_decode,
-    decode_address,
-    generate_address,
-    seeds,
-)
+from __future__ import annotations
 
-__all__ = [
-    "EnigmaticMessage",
-    "EncodingConfig",
-    "HandshakeParameters",
-    "HandshakePhase",
-    "HandshakeRole",
-    "HandshakeState",
-    "create_handshake_init_message",
-    "create_handshake_resp_message",
-    "create_initiator_state",
-    "create_responder_state",
-    "derive_session_key",
-    "initiator_build_init_message",
-    "initiator_process_resp",
-    "responder_process_init_and_build_resp",
-    "BinaryEncodingError",
-    "BinaryUTXOPacket",
-    "decode_binary_packets_to_text",
-    "encode_text_to_binary_packets",
-    "format_packets_human_readable",
-    "DTSPEncodingError",
-    "DTSP_ALPHABET",
-    "DTSP_CONTROL",
-    "DTSP_DIGITS",
-    "DTSP_LETTERS",
-    "DTSP_SPECIALS",
-    "DTSP_TOLERANCE",
-    "closest_dtsp_symbol",
-    "decode_dtsp_sequence_to_message",
-    "encode_handshake_accept",
-    "encode_handshake_end",
-    "encode_handshake_start",
-    "encode_message_to_dtsp_sequence",
-    "format_dtsp_table",
-    "OrdinalIndexer",
-    "OrdinalLocation",
-    "OrdinalScanConfig",
-    "OrdinalInscriptionDecoder",
-    "OrdinalInscriptionPlanner",
-    "InscriptionMetadata",
-    "InscriptionPayload",
-    "encode_enig_taproot_payload",
-    "decode_enig_taproot_payload",
-    "ENIG_TAPROOT_MAGIC",
-    "ENIG_TAPROOT_VERSION_V1",
-    "ENIG_TAPROOT_PROTOCOL",
-    "TaprootScriptView",
-    "inspect_output_for_taproot",
-    "base58_check_encode",
-    "base58_decode",
-    "b58_digits",
-    "b58_dcmap",
-    "decode_address",
-    "generate_address",
-    "seeds",
-]
+import importlib
+from typing import Any
+
+# Public names resolve from their submodules on first access, so importing the
+# package (or just ``enigmatic_dgb.cli``) does not load the RPC and ordinal
+# stacks until something actually uses them.
+_LAZY_IMPORTS: dict[str, tuple[str, ...]] = {
+    "model": ("EnigmaticMessage", "EncodingConfig"),
+    "handshake": (
+        "HandshakeParameters",
+        "HandshakePhase",
+        "HandshakeRole",
+        "HandshakeState",
+        "create_handshake_init_message",
+        "create_handshake_resp_message",
+        "create_initiator_state",
+        "create_responder_state",
+        "derive_session_key",
+        "initiator_build_init_message",
+        "initiator_process_resp",
+        "responder_process_init_and_build_resp",
+    ),
+    "binary_packets": (
+        "BinaryEncodingError",
+        "BinaryUTXOPacket",
+        "decode_binary_packets_to_text",
+        "encode_text_to_binary_packets",
+        "encode_text_to_satoshis",
+        "format_packets_human_readable",
+    ),
+    "dtsp": (
+        "DTSPEncodingError",
+        "DTSP_ALPHABET",
+        "DTSP_CONTROL",
+        "DTSP_DIGITS",
+        "DTSP_LETTERS",
+        "DTSP_SPECIALS",
+        "DTSP_TOLERANCE",
+        "closest_dtsp_symbol",
+        "decode_dtsp_sequence_to_message",
+        "encode_handshake_accept",
+        "encode_handshake_end",
+        "encode_handshake_start",
+        "encode_message_to_dtsp_sequence",
+        "format_dtsp_table",
+    ),
+    "ordinals": (
+        "OrdinalIndexer",
+        "OrdinalLocation",
+        "OrdinalScanConfig",
+        "OrdinalInscriptionDecoder",
+        "OrdinalInscriptionPlanner",
+        "InscriptionMetadata",
+        "InscriptionPayload",
+        "encode_enig_taproot_payload",
+        "decode_enig_taproot_payload",
+        "ENIG_TAPROOT_MAGIC",
+        "ENIG_TAPROOT_VERSION_V1",
+        "ENIG_TAPROOT_PROTOCOL",
+        "TaprootScriptView",
+        "inspect_output_for_taproot",
+    ),
+    "unspendable": (
+        "base58_check_encode",
+        "base58_decode",
+        "b58_digits",
+        "b58_dcmap",
+        "decode_address",
+        "generate_address",
+        "seeds",
+    ),
+}
+_LAZY_ATTRIBUTES = {
+    name: module for module, names in _LAZY_IMPORTS.items() for name in names
+}
+
+__all__ = [name for names in _LAZY_IMPORTS.values() for name in names]
+
+
+def __getattr__(name: str) -> Any:
+    module = _LAZY_ATTRIBUTES.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -2,19 +2,39 @@
 
 from __future__ import annotations
 
+import io
 from dataclasses import dataclass
 from decimal import Decimal, ROUND_DOWN
-from typing import Iterable, List, Sequence
+from functools import lru_cache
+from typing import Dict, Iterable, List, TextIO, Tuple
 
+# Bit widths up to this size are encoded through a cached per-code table.
+_TABLE_MAX_BITS = 8
+# Wider widths up to this size still look their bitstrings up in a table.
+_BIT_TABLE_MAX_BITS = 16
+# DigiByte amounts carry eight decimal places (one satoshi = 1e-8 DGB).
+_SATOSHI_DECIMALS = 8
 
-@dataclass
+
+@dataclass(frozen=True)
 class BinaryUTXOPacket:
     """Represents a single binary-encoded character carried by a UTXO output."""
 
+    # Declared by hand because ``dataclass(slots=True)`` requires Python 3.10.
+    __slots__ = ("letter", "bits", "amount")
+
     letter: str
     bits: str
     amount: Decimal
 
+    def __getstate__(self) -> Tuple[str, str, Decimal]:
+        return (self.letter, self.bits, self.amount)
+
+    def __setstate__(self, state: Tuple[str, str, Decimal]) -> None:
+        # Frozen instances reject normal assignment, so restore via object.
+        for name, value in zip(self.__slots__, state):
+            object.__setattr__(self, name, value)
+
 
 class BinaryEncodingError(ValueError):
     """Raised when binary encoding or decoding fails."""
@@ -26,6 +46,77 @@ def _build_quantizer(bits_per_char: int) -> Decimal:
     return Decimal(f"1e-{bits_per_char}")
 
 
+@lru_cache(maxsize=None)
+def _bit_format(bits_per_char: int) -> str:
+    """Return the zero-padded binary format spec for ``bits_per_char``."""
+
+    return f"0{bits_per_char}b"
+
+
+@lru_cache(maxsize=4)
+def _bit_table(bits_per_char: int) -> Tuple[str, ...]:
+    """Return the bitstring for every code of ``bits_per_char``, by code."""
+
+    bit_format = _bit_format(bits_per_char)
+    return tuple(format(code, bit_format) for code in range(1 << bits_per_char))
+
+
+def _scaled_base(base_amount: Decimal, bits_per_char: int) -> int:
+    """Return ``base_amount`` in units of ``10**-bits_per_char`` (truncated)."""
+
+    return int(base_amount.scaleb(bits_per_char).to_integral_value(rounding=ROUND_DOWN))
+
+
+@lru_cache(maxsize=16)
+def _packet_table(
+    base_amount: Decimal, bits_per_char: int
+) -> Tuple[BinaryUTXOPacket, ...]:
+    """Precompute one shared packet for every code of a narrow bit width.
+
+    Packets are immutable, so every occurrence of a letter in encoded text can
+    reference the same instance.
+    """
+
+    base_scaled = _scaled_base(base_amount, bits_per_char)
+    exponent = -bits_per_char
+    return tuple(
+        BinaryUTXOPacket(
+            chr(code), bits, Decimal(base_scaled + int(bits)).scaleb(exponent)
+        )
+        for code, bits in enumerate(_bit_table(bits_per_char))
+    )
+
+
+@lru_cache(maxsize=4)
+def _letter_table(bits_per_char: int) -> Dict[int, str]:
+    """Map each bitstring, read as a decimal integer, back to its character."""
+
+    return {int(bits): chr(code) for code, bits in enumerate(_bit_table(bits_per_char))}
+
+
+@lru_cache(maxsize=16)
+def _satoshi_table(base_amount: Decimal, bits_per_char: int) -> Tuple[int, ...]:
+    """Precompute the satoshi amount for every code of a narrow bit width."""
+
+    base_scaled = _scaled_base(base_amount, bits_per_char)
+    scale = 10 ** (_SATOSHI_DECIMALS - bits_per_char)
+    return tuple(
+        (base_scaled + int(bits)) * scale for bits in _bit_table(bits_per_char)
+    )
+
+
+def _narrow_codepoints(text: str, bits_per_char: int) -> List[int]:
+    """Return the codepoints of ``text``, rejecting any wider than the width."""
+
+    codepoints = [ord(letter) for letter in text]
+    if codepoints and max(codepoints) >> bits_per_char:
+        letter = next(chr(c) for c in codepoints if c >> bits_per_char)
+        raise BinaryEncodingError(
+            f"letter '{letter}' cannot be represented with {bits_per_char} bits"
+        )
+    return codepoints
+
+
 def encode_text_to_binary_packets(
     text: str, *, base_amount: Decimal = Decimal("0.0001"), bits_per_char: int = 8
 ) -> List[BinaryUTXOPacket]:
@@ -36,25 +127,65 @@ def encode_text_to_binary_packets(
     after the decimal point of the output amount, offset by ``base_amount``.
     """
 
-    quantizer = _build_quantizer(bits_per_char)
-    packets: List[BinaryUTXOPacket] = []
+    _build_quantizer(bits_per_char)
+    if bits_per_char <= _TABLE_MAX_BITS:
+        # Every representable character fits in a small table, so the whole
+        # string reduces to one range check plus a lookup per character.
+        table = _packet_table(base_amount, bits_per_char)
+        return [
+            table[codepoint] for codepoint in _narrow_codepoints(text, bits_per_char)
+        ]
 
-    for letter in text:
+    # Work in units of 10**-bits_per_char so each amount is a single integer
+    # addition followed by one exponent shift instead of a string parse, a
+    # Decimal addition, and a quantize per character.
+    base_scaled = _scaled_base(base_amount, bits_per_char)
+    exponent = -bits_per_char
+    bit_format = _bit_format(bits_per_char)
+    bit_table = (
+        _bit_table(bits_per_char) if bits_per_char <= _BIT_TABLE_MAX_BITS else None
+    )
+    packets: List[BinaryUTXOPacket] = [None] * len(text)  # type: ignore[list-item]
+
+    for index, letter in enumerate(text):
         codepoint = ord(letter)
-        if codepoint >= 2**bits_per_char:
+        # Any bit above the low bits_per_char means the code does not fit.
+        if codepoint >> bits_per_char:
             raise BinaryEncodingError(
                 f"letter '{letter}' cannot be represented with {bits_per_char} bits"
             )
-        bits = format(codepoint, f"0{bits_per_char}b")
-        fractional = Decimal(f"0.{bits}")
-        amount = (base_amount + fractional).quantize(quantizer, rounding=ROUND_DOWN)
-        packets.append(BinaryUTXOPacket(letter=letter, bits=bits, amount=amount))
+        if bit_table is not None:
+            bits = bit_table[codepoint]
+        else:
+            bits = format(codepoint, bit_format)
+        amount = Decimal(base_scaled + int(bits)).scaleb(exponent)
+        packets[index] = BinaryUTXOPacket(letter=letter, bits=bits, amount=amount)
 
     return packets
 
 
+def encode_text_to_satoshis(
+    text: str, *, base_amount: Decimal = Decimal("0.0001"), bits_per_char: int = 8
+) -> List[int]:
+    """Encode text directly into integer satoshi output amounts.
+
+    The values equal the ``amount`` of each packet from
+    :func:`encode_text_to_binary_packets` expressed in satoshis, without
+    building ``Decimal`` amounts or packet objects. Only widths of up to eight
+    bits land on whole satoshis.
+    """
+
+    _build_quantizer(bits_per_char)
+    if bits_per_char > _SATOSHI_DECIMALS:
+        raise BinaryEncodingError(
+            f"{bits_per_char}-bit packets are finer than one satoshi"
+        )
+    table = _satoshi_table(base_amount, bits_per_char)
+    return [table[codepoint] for codepoint in _narrow_codepoints(text, bits_per_char)]
+
+
 def decode_binary_packets_to_text(
-    amounts: Sequence[Decimal],
+    amounts: Iterable[Decimal],
     *,
     base_amount: Decimal = Decimal("0.0001"),
     bits_per_char: int = 8,
@@ -65,30 +196,63 @@ def decode_binary_packets_to_text(
     expects exactly ``bits_per_char`` decimal digits and ensures all digits are
     binary (``0`` or ``1``)."""
 
-    quantizer = _build_quantizer(bits_per_char)
-    letters: List[str] = []
+    _build_quantizer(bits_per_char)
+    modulus = 10**bits_per_char
+    # Narrow widths map the digit block straight to a character; a miss means
+    # the block held a digit other than 0 or 1.
+    letter_table = (
+        _letter_table(bits_per_char) if bits_per_char <= _TABLE_MAX_BITS else None
+    )
+    # Materialized so generators still work with the presized output list.
+    amounts = list(amounts)
+    letters: List[str] = [""] * len(amounts)
 
-    for amount in amounts:
-        normalized = (amount - base_amount).quantize(quantizer, rounding=ROUND_DOWN)
-        digits = f"{normalized:.{bits_per_char}f}".split(".")[1][:bits_per_char]
-        if len(digits) != bits_per_char:
+    for index, amount in enumerate(amounts):
+        offset = amount - base_amount
+        if not offset.is_finite():
             raise BinaryEncodingError(
                 f"amount {amount} does not contain {bits_per_char} decimal digits"
             )
-        if any(d not in {"0", "1"} for d in digits):
+        # Shift the fractional digits into an integer (int() truncates like
+        # ROUND_DOWN) and keep only the last bits_per_char of them; the sign
+        # and whole-coin part never carried payload bits.
+        block = abs(int(offset.scaleb(bits_per_char))) % modulus
+        if letter_table is not None:
+            letter = letter_table.get(block)
+            if letter is not None:
+                letters[index] = letter
+                continue
+        digits = str(block).zfill(bits_per_char)
+        if digits.strip("01"):
             raise BinaryEncodingError(
                 f"amount {amount} contains non-binary decimal digits: {digits}"
             )
-        codepoint = int(digits, 2)
-        letters.append(chr(codepoint))
+        letters[index] = chr(int(digits, 2))
 
     return "".join(letters)
 
 
-def format_packets_human_readable(packets: Iterable[BinaryUTXOPacket]) -> str:
-    """Render a summary of packets showing letter, bits, and amount."""
+def format_packets_human_readable(
+    packets: Iterable[BinaryUTXOPacket], *, out: TextIO | None = None
+) -> str | None:
+    """Render a summary of packets showing letter, bits, and amount.
+
+    When ``out`` is given the table is streamed to it line by line (with a
+    trailing newline) and ``None`` is returned instead of the rendered string.
+    """
 
-    lines = ["letter | bits | amount"]
+    buffer: io.StringIO | None = None
+    target: TextIO
+    if out is None:
+        buffer = io.StringIO()
+        target = buffer
+    else:
+        target = out
+    write = target.write
+    write("letter | bits | amount")
     for packet in packets:
-        lines.append(f"{packet.letter} | {packet.bits} | {packet.amount}")
-    return "\n".join(lines)
+        write(f"\n{packet.letter} | {packet.bits} | {packet.amount}")
+    if buffer is None:
+        write("\n")
+        return None
+    return buffer.getvalue()
@@ -10,107 +10,219 @@ presence and identity signaling without writing custom Python.
 """
 
 import argparse
-import base64
-import binascii
+import importlib
 import json
 import logging
 from math import isclose
-import shutil
-import subprocess
+import re
 import sys
-import textwrap
 import time
-from collections import defaultdict, OrderedDict
-from datetime import datetime, timezone
 from pathlib import Path
+from types import ModuleType
 from decimal import Decimal, InvalidOperation
-from typing import Any, Callable, Iterable, Sequence
-from uuid import uuid4
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, Callable, Iterable, Sequence
 
 import yaml
-from .binary_packets import (
-    BinaryEncodingError,
-    decode_binary_packets_to_text,
-    encode_text_to_binary_packets,
-    format_packets_human_readable,
-)
-from .dialect import DialectError, load_dialect
-from .encoder import EnigmaticEncoder, SpendInstruction, aggregate_spend_instructions
-from .dtsp import (
-    DTSPEncodingError,
-    DTSP_CONTROL,
-    DTSP_TOLERANCE,
-    closest_dtsp_symbol,
-    decode_dtsp_sequence_to_message,
-    encode_message_to_dtsp_sequence,
-    format_dtsp_table,
-)
-from .model import EncodingConfig, EnigmaticMessage
-from .planner import (
-    AutomationDialect,
-    DUST_LIMIT,
-    PatternPlan,
-    PatternPlanSequence,
-    PlanningError,
-    PlannedChain,
-    SymbolPlanner,
-    broadcast_pattern_plan,
-    plan_explicit_pattern,
-    plan_independent_pattern,
-    PREVIOUS_CHANGE_SENTINEL,
-)
-from .ordinals import (
-    InscriptionPayload,
-    OrdinalIndexer,
-    OrdinalInscriptionDecoder,
-    OrdinalInscriptionPlanner,
-    OrdinalOwnershipView,
-    OrdinalScanConfig,
-)
-from .ordinals.workflows import (
-    compute_taproot_envelope_stats,
-    prepare_inscription_transaction,
-    suggest_max_fee_sats,
-    write_receipt,
-)
-from .ordinals.reveal import TaprootRevealError, build_taproot_reveal_tx
-from .ordinals.taproot_builder import (
-    compute_taproot_output_from_script,
-    create_taproot_address,
-)
-from .ordinals.index_store import SQLiteOrdinalIndexStore
+
+orjson: ModuleType | None
+try:  # Optional faster JSON encoder (``pip install enigmatic-dgb[fast]``).
+    import orjson
+except ImportError:  # pragma: no cover - depends on installed extras
+    orjson = None
+
 from .config import (
-    ConfigurationError,
     DEFAULT_CONFIG_DIR,
     DEFAULT_CONFIG_PATH,
     LEGACY_CONFIG_PATH,
     load_rpc_config,
     set_default_config_path,
 )
-from .rpc_client import DigiByteRPC, RPCError, RPCTransportError, format_rpc_hint
-from .script_plane import ScriptPlane
-from .session import SessionContext
-from .symbol_sender import SessionRequiredError, prepare_symbol_send
-from .tx_builder import TransactionBuilder
-from .watcher import Watcher
-from .fees import (
-    DEFAULT_CONF_TARGET,
-    DEFAULT_ESTIMATE_MODE,
-    FeeSelectionResult,
-    calculate_fee_sats,
-    format_floors_for_log,
-    sat_vb_to_dgb_per_kvb,
-    select_fee_rate,
-)
 
-logging.basicConfig(level=logging.INFO)
+if TYPE_CHECKING:
+    import subprocess
+
+    from .config import RPCConfig
+    from .encoder import SpendInstruction
+    from .model import EncodingConfig, EnigmaticMessage
+    from .ordinals import InscriptionPayload
+    from .ordinals.index_store import SQLiteOrdinalIndexStore
+    from .planner import PatternPlanSequence, PlannedChain
+    from .rpc_client import DigiByteRPC
+    from .script_plane import ScriptPlane
+    from .tx_builder import TransactionBuilder
+
 logger = logging.getLogger(__name__)
 
 COMPACT_JSON_SEPARATORS = (",", ":")
+# Built once: json.dumps constructs a fresh encoder whenever any option is set.
+_COMPACT_ENCODER = json.JSONEncoder(separators=COMPACT_JSON_SEPARATORS)
 MAX_OUTPUTS_PER_TX = 50
+# Standard relay policy caps transactions at 100k vbytes; at roughly 34 vbytes
+# per output that leaves room for a little under 3000 outputs plus inputs.
+POLICY_MAX_OUTPUTS_PER_TX = 2500
 TAPROOT_WIZARD_DEFAULT_WALLET = "taproot-lab"
 EIGHT_DP = Decimal("0.00000001")
 AUTO_PREP_BUFFER = Decimal("0.0002")
+_UTXO_REF_RE = re.compile(r"([0-9a-fA-F]{64}):([0-9]+)")
+# Parser defaults, spelled out so building --help does not import dtsp/planner.
+_DTSP_TOLERANCE_DEFAULT = 1e-10  # dtsp.DTSP_TOLERANCE
+_POSTAGE_DGB_DEFAULT = "0.00010000"  # planner.DUST_LIMIT
+
+# Subcommands import what they need when they run. Names this module used to
+# import eagerly stay reachable as ``cli.<name>`` through ``__getattr__``.
+_LAZY_IMPORTS: dict[str, tuple[str, ...]] = {
+    "binary_packets": (
+        "BinaryEncodingError",
+        "decode_binary_packets_to_text",
+        "encode_text_to_binary_packets",
+        "format_packets_human_readable",
+    ),
+    "config": ("ConfigurationError",),
+    "dialect": ("DialectError", "load_dialect"),
+    "dtsp": (
+        "DTSPEncodingError",
+        "DTSP_CONTROL",
+        "DTSP_TOLERANCE",
+        "closest_dtsp_symbol",
+        "decode_dtsp_sequence_to_message",
+        "encode_message_to_dtsp_sequence",
+        "format_dtsp_table",
+    ),
+    "encoder": (
+        "EnigmaticEncoder",
+        "SpendInstruction",
+        "aggregate_spend_instructions",
+    ),
+    "fees": (
+        "DEFAULT_CONF_TARGET",
+        "DEFAULT_ESTIMATE_MODE",
+        "FeeSelectionResult",
+        "calculate_fee_sats",
+        "format_floors_for_log",
+        "sat_vb_to_dgb_per_kvb",
+        "select_fee_rate",
+    ),
+    "model": ("EncodingConfig", "EnigmaticMessage"),
+    "ordinals": (
+        "InscriptionPayload",
+        "OrdinalIndexer",
+        "OrdinalInscriptionDecoder",
+        "OrdinalInscriptionPlanner",
+        "OrdinalOwnershipView",
+        "OrdinalScanConfig",
+    ),
+    "ordinals.index_store": ("SQLiteOrdinalIndexStore",),
+    "ordinals.reveal": ("TaprootRevealError", "build_taproot_reveal_tx"),
+    "ordinals.taproot_builder": (
+        "compute_taproot_output_from_script",
+        "create_taproot_address",
+    ),
+    "ordinals.workflows": (
+        "compute_taproot_envelope_stats",
+        "prepare_inscription_transaction",
+        "suggest_max_fee_sats",
+        "write_receipt",
+    ),
+    "planner": (
+        "AutomationDialect",
+        "DUST_LIMIT",
+        "PatternPlan",
+        "PatternPlanSequence",
+        "PlanningError",
+        "PlannedChain",
+        "SymbolPlanner",
+        "broadcast_pattern_plan",
+        "plan_explicit_pattern",
+        "plan_independent_pattern",
+        "PREVIOUS_CHANGE_SENTINEL",
+    ),
+    "rpc_client": (
+        "DigiByteRPC",
+        "RPCError",
+        "RPCTransportError",
+        "format_rpc_hint",
+    ),
+    "script_plane": ("ScriptPlane",),
+    "session": ("SessionContext",),
+    "symbol_sender": ("SessionRequiredError", "prepare_symbol_send"),
+    "tx_builder": ("TransactionBuilder",),
+    "watcher": ("Watcher",),
+}
+_LAZY_ATTRIBUTES = {
+    name: module for module, names in _LAZY_IMPORTS.items() for name in names
+}
+
+
+def __getattr__(name: str) -> Any:
+    module = _LAZY_ATTRIBUTES.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module}", __package__), name)
+    globals()[name] = value
+    return value
+
+
+def _dumps_compact(data: Any) -> str:
+    """Serialize ``data`` as compact JSON, preferring orjson when installed."""
+
+    if orjson is not None:
+        try:
+            return orjson.dumps(data).decode("utf-8")
+        except TypeError:
+            pass  # Non-string keys and similar; let the stdlib encoder decide.
+    return _COMPACT_ENCODER.encode(data)
+
+
+def _dumps_compact_bytes(data: Any) -> bytes:
+    """Serialize ``data`` as compact UTF-8 JSON bytes, preferring orjson."""
+
+    if orjson is not None:
+        try:
+            return orjson.dumps(data)
+        except TypeError:
+            pass
+    return _COMPACT_ENCODER.encode(data).encode("utf-8")
+
+
+def _dumps_pretty(data: Any) -> str:
+    """Serialize ``data`` as two-space indented JSON."""
+
+    if orjson is not None:
+        try:
+            return orjson.dumps(data, option=orjson.OPT_INDENT_2).decode("utf-8")
+        except TypeError:
+            pass
+    return json.dumps(data, indent=2)
+
+
+def _print_json_array(items: Iterable[Any]) -> None:
+    """Print ``items`` as ``print(_dumps_pretty(list(items)))`` would.
+
+    Elements are serialized and written one at a time, so large listings never
+    hold the whole document in memory.
+    """
+
+    write = sys.stdout.write
+    separator = "[\n  "
+    for item in items:
+        write(separator)
+        # JSON escapes newlines inside strings, so every raw newline is layout.
+        write(_dumps_pretty(item).replace("\n", "\n  "))
+        separator = ",\n  "
+    write("[]\n" if separator == "[\n  " else "\n]\n")
+
+
+def _loads(text: str) -> Any:
+    """Parse JSON text, preferring orjson when installed."""
+
+    if orjson is not None:
+        try:
+            return orjson.loads(text)
+        except orjson.JSONDecodeError:
+            pass  # Integers beyond 64 bits and similar; let the stdlib decide.
+    return json.loads(text)
+
 
 RESERVED_PLANE_MARKERS = (
     # Table 2.8 reserved combinations for value, fee, cardinality, and cadence.
@@ -148,12 +260,30 @@ class CLIError(RuntimeError):
 def _rpc_client(overrides: dict[str, Any] | None = None) -> DigiByteRPC:
     """Return an RPC client using shared config + optional overrides."""
 
+    from .rpc_client import DigiByteRPC
+
     return DigiByteRPC(load_rpc_config(overrides=overrides))
 
 
+@lru_cache(maxsize=1)
+def _default_config() -> EncodingConfig:
+    """Return the shared reference encoding config (treat as read-only)."""
+
+    from .model import EncodingConfig
+
+    return EncodingConfig.enigmatic_default()
+
+
+@lru_cache(maxsize=1024)
+def _decimal(literal: str) -> Decimal:
+    """Return ``Decimal(literal)``, reusing instances for repeated literals."""
+
+    return Decimal(literal)
+
+
 def _parse_decimal_list(raw: str) -> list[Decimal]:
     try:
-        decimals = [Decimal(piece.strip()) for piece in raw.split(",") if piece.strip()]
+        decimals = [_decimal(piece) for piece in _split_csv(raw)]
     except InvalidOperation as exc:  # pragma: no cover - argument validation
         raise CLIError(f"invalid decimal amount in: {raw}") from exc
     if not decimals:
@@ -181,6 +311,8 @@ def _prompt_bool(prompt: str, default: bool = False) -> bool:
 
 
 def _digibyte_cli_available() -> bool:
+    import shutil
+
     return shutil.which("digibyte-cli") is not None
 
 
@@ -211,6 +343,8 @@ def _write_rpc_config_file(rpc_config: dict[str, Any]) -> Path:
 def _run_digibyte_cli(
     rpc_config: RPCConfig, args: list[str], *, wallet: str | None = None
 ) -> subprocess.CompletedProcess[str]:
+    import subprocess
+
     if not _digibyte_cli_available():
         raise CLIError("digibyte-cli is not available on PATH")
     base = [
@@ -244,6 +378,8 @@ def _probe_rpc_connectivity(rpc: DigiByteRPC) -> tuple[bool, str | None]:
 
 
 def _offer_taproot_wallet_setup(rpc_config: RPCConfig) -> None:
+    import subprocess
+
     if not _digibyte_cli_available():
         print("digibyte-cli not found; skip Taproot wallet bootstrap.\n")
         return
@@ -340,6 +476,8 @@ def _run_cli_command(argv: list[str]) -> int:
 
 
 def _quickstart_menu(rpc_config: RPCConfig) -> None:
+    import textwrap
+
     print(
         textwrap.dedent(
             """
@@ -449,6 +587,8 @@ def _quickstart_menu(rpc_config: RPCConfig) -> None:
 
 
 def cmd_quickstart(args: argparse.Namespace) -> None:
+    import textwrap
+
     print(
         textwrap.dedent(
             """
@@ -488,8 +628,10 @@ def cmd_quickstart(args: argparse.Namespace) -> None:
     _quickstart_menu(rpc.config)
 
 
-def build_parser() -> argparse.ArgumentParser:
-    parser = argparse.ArgumentParser(description="Enigmatic DigiByte CLI")
+def _build_root_parser(*, add_help: bool = True) -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        description="Enigmatic DigiByte CLI", add_help=add_help
+    )
     parser.add_argument(
         "--verbose",
         "--debug",
@@ -503,12 +645,103 @@ def build_parser() -> argparse.ArgumentParser:
             "is also read). Overrides environment when provided."
         ),
     )
+    return parser
+
+
+def _requested_command(argv: Sequence[str] | None) -> str | None:
+    """Return the known subcommand named in ``argv`` without running argparse.
+
+    The first positional token is the command; the value following
+    ``--config`` (or an unambiguous prefix of it) is skipped. ``None`` means
+    the full parser should be built, e.g. for ``--help`` or unknown input.
+    """
+
+    tokens = list(sys.argv[1:] if argv is None else argv)
+    index = 0
+    while index < len(tokens):
+        token = tokens[index]
+        if token == "--":
+            index += 1
+            break
+        if not token.startswith("-"):
+            break
+        if len(token) > 2 and "--config".startswith(token):
+            index += 1  # skip the config path
+        index += 1
+    else:
+        return None
+    if index < len(tokens) and tokens[index] in _SUBPARSER_BUILDERS:
+        return tokens[index]
+    return None
+
+
+@lru_cache(maxsize=None)
+def build_parser(command: str | None = None) -> argparse.ArgumentParser:
+    """Return the CLI parser, optionally populated for a single command.
+
+    When ``command`` names a known subcommand only that subparser is built,
+    which keeps single invocations from paying for the full command tree.
+    Parsers are cached so repeated ``main()`` calls reuse them.
+    """
+
+    parser = _build_root_parser()
     subparsers = parser.add_subparsers(dest="command", required=True)
+    if command in _SUBPARSER_BUILDERS:
+        _SUBPARSER_BUILDERS[command](subparsers)
+    else:
+        for add_subparser in _SUBPARSER_BUILDERS.values():
+            add_subparser(subparsers)
+    return parser
 
+
+class _DiscardingParser:
+    """Parser stand-in that accepts and ignores any configuration call."""
+
+    def __getattr__(self, name: str) -> Callable[..., _DiscardingParser]:
+        return self._discard
+
+    def _discard(self, *args: Any, **kwargs: Any) -> _DiscardingParser:
+        return self
+
+
+class _CommandHelpRecorder:
+    """Subparsers stand-in that records each command's name and help text."""
+
+    def __init__(self) -> None:
+        self.commands: list[tuple[str, str | None]] = []
+
+    def add_parser(self, name: str, **kwargs: Any) -> _DiscardingParser:
+        self.commands.append((name, kwargs.get("help")))
+        return _DiscardingParser()
+
+
+@lru_cache(maxsize=None)
+def _build_overview_parser() -> argparse.ArgumentParser:
+    """Return a parser that lists every command without its arguments.
+
+    ``main()`` uses it when ``argv`` names no known command. That parse can
+    only end in the top-level help or a usage error, and both render just
+    the command names and help strings, so the full argument tree is skipped.
+    """
+
+    recorder = _CommandHelpRecorder()
+    for add_subparser in _SUBPARSER_BUILDERS.values():
+        add_subparser(recorder)  # type: ignore[arg-type]
+    parser = _build_root_parser()
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    for name, help_text in recorder.commands:
+        subparsers.add_parser(name, help=help_text, add_help=False)
+    return parser
+
+
+def _add_console_parser(subparsers: argparse._SubParsersAction) -> None:
     subparsers.add_parser(
         "console",
         help="Launch the interactive Enigmatic console (ASCII menu UI)",
     )
+
+
+def _add_quickstart_parser(subparsers: argparse._SubParsersAction) -> None:
     subparsers.add_parser(
         "quickstart",
         help=(
@@ -517,6 +750,8 @@ def build_parser() -> argparse.ArgumentParser:
         ),
     )
 
+
+def _add_dialect_parser(subparsers: argparse._SubParsersAction) -> None:
     dialect_parser = subparsers.add_parser(
         "dialect", help="List, validate, or generate dialect YAML files"
     )
@@ -549,6 +784,8 @@ def build_parser() -> argparse.ArgumentParser:
         help="Overwrite the output file if it already exists",
     )
 
+
+def _add_send_message_parser(subparsers: argparse._SubParsersAction) -> None:
     send_parser = subparsers.add_parser(
         "send-message", help="encode a message and broadcast the spend pattern"
     )
@@ -582,6 +819,7 @@ def build_parser() -> argparse.ArgumentParser:
     )
     send_parser.add_argument(
         "--fee",
+        type=_decimal_arg,
         default=None,
         help="Override the per-transaction fee punctuation (default: config value)",
     )
@@ -590,12 +828,23 @@ def build_parser() -> argparse.ArgumentParser:
         default=None,
         help="Optional shared secret used to encrypt the message payload",
     )
+    send_parser.add_argument(
+        "--max-outputs-per-tx",
+        type=int,
+        default=MAX_OUTPUTS_PER_TX,
+        help=(
+            "Maximum spend instructions packed into each transaction "
+            f"(default: {MAX_OUTPUTS_PER_TX})"
+        ),
+    )
     send_parser.add_argument(
         "--dry-run",
         action="store_true",
         help="Preview the encoded outputs without broadcasting transactions",
     )
 
+
+def _add_watch_parser(subparsers: argparse._SubParsersAction) -> None:
     watch_parser = subparsers.add_parser(
         "watch", help="watch an address for Enigmatic packets"
     )
@@ -612,6 +861,8 @@ def build_parser() -> argparse.ArgumentParser:
         help="Validate RPC connectivity without starting the polling loop",
     )
 
+
+def _add_dtsp_encode_parser(subparsers: argparse._SubParsersAction) -> None:
     dtsp_encode_parser = subparsers.add_parser(
         "dtsp-encode", help="encode a plaintext string using the DTSP mapping"
     )
@@ -627,6 +878,8 @@ def build_parser() -> argparse.ArgumentParser:
         help="Insert an accept code after the start code (implies handshake)",
     )
 
+
+def _add_dtsp_decode_parser(subparsers: argparse._SubParsersAction) -> None:
     dtsp_decode_parser = subparsers.add_parser(
         "dtsp-decode", help="decode DTSP amounts back into plaintext"
     )
@@ -642,8 +895,11 @@ def build_parser() -> argparse.ArgumentParser:
     dtsp_decode_parser.add_argument(
         "--tolerance",
         type=float,
-        default=DTSP_TOLERANCE,
-        help="Absolute tolerance when matching DTSP values (default: %(default)s)",
+        default=_DTSP_TOLERANCE_DEFAULT,
+        help=(
+            "Absolute tolerance when matching DTSP values "
+            f"(default: {_DTSP_TOLERANCE_DEFAULT})"
+        ),
     )
     dtsp_decode_parser.add_argument(
         "--show-matches",
@@ -651,10 +907,14 @@ def build_parser() -> argparse.ArgumentParser:
         help="Print per-value symbol matches and errors",
     )
 
+
+def _add_dtsp_table_parser(subparsers: argparse._SubParsersAction) -> None:
     subparsers.add_parser(
         "dtsp-table", help="print the DTSP substitution and handshake table"
     )
 
+
+def _add_unspendable_parser(subparsers: argparse._SubParsersAction) -> None:
     unspendable_parser = subparsers.add_parser(
         "unspendable",
         help="Generate a human-readable unspendable address",
@@ -673,6 +933,8 @@ def build_parser() -> argparse.ArgumentParser:
         help="Message to encode inside the unspendable address",
     )
 
+
+def _add_unspendable_decode_parser(subparsers: argparse._SubParsersAction) -> None:
     unspendable_decode_parser = subparsers.add_parser(
         "unspendable-decode",
         help="Decode a human-readable unspendable address",
@@ -684,6 +946,8 @@ def build_parser() -> argparse.ArgumentParser:
         help="Optional expected prefix category (e.g., DAx, DBx, DCx); raises if the decoded prefix differs.",
     )
 
+
+def _add_binary_utxo_encode_parser(subparsers: argparse._SubParsersAction) -> None:
     binary_encode_parser = subparsers.add_parser(
         "binary-utxo-encode",
         help="encode text into binary decimal UTXO packet amounts",
@@ -691,6 +955,7 @@ def build_parser() -> argparse.ArgumentParser:
     binary_encode_parser.add_argument("message", help="Text to encode")
     binary_encode_parser.add_argument(
         "--base-amount",
+        type=_decimal_arg,
         default="0.0001",
         help="Decimal prefix added to every output amount (default: 0.0001)",
     )
@@ -701,6 +966,8 @@ def build_parser() -> argparse.ArgumentParser:
         help="Bit width used for each character (default: 8)",
     )
 
+
+def _add_binary_utxo_decode_parser(subparsers: argparse._SubParsersAction) -> None:
     binary_decode_parser = subparsers.add_parser(
         "binary-utxo-decode",
         help="decode binary decimal packet amounts back into text",
@@ -711,6 +978,7 @@ def build_parser() -> argparse.ArgumentParser:
     )
     binary_decode_parser.add_argument(
         "--base-amount",
+        type=_decimal_arg,
         default="0.0001",
         help="Decimal prefix added during encoding (default: 0.0001)",
     )
@@ -721,6 +989,8 @@ def build_parser() -> argparse.ArgumentParser:
         help="Bit width used during encoding (default: 8)",
     )
 
+
+def _add_send_symbol_parser(subparsers: argparse._SubParsersAction) -> None:
     symbol_parser = subparsers.add_parser(
         "send-symbol", help="send a symbolic dialect pattern"
     )
@@ -772,6 +1042,7 @@ def build_parser() -> argparse.ArgumentParser:
     )
     symbol_parser.add_argument(
         "--fee",
+        type=_decimal_arg,
         default=None,
         help="Override the per-transaction fee punctuation defined by the dialect",
     )
@@ -781,6 +1052,8 @@ def build_parser() -> argparse.ArgumentParser:
         help="Encode and summarize the symbol without broadcasting",
     )
 
+
+def _add_plan_symbol_parser(subparsers: argparse._SubParsersAction) -> None:
     planner_parser = subparsers.add_parser(
         "plan-symbol",
         help="Plan or broadcast a symbol defined in an automation dialect",
@@ -819,6 +1092,33 @@ def build_parser() -> argparse.ArgumentParser:
         help="Limit the number of frames when planning a chained symbol",
     )
 
+
+def _add_confirmation_pacing_args(
+    parser: argparse.ArgumentParser, *, between: str = "steps"
+) -> None:
+    """Add the wait/confirmation pacing flags shared by chained broadcasts."""
+
+    parser.add_argument(
+        "--wait-between-txs",
+        type=float,
+        default=0.0,
+        help="Seconds to wait between chained broadcasts or confirmation polls",
+    )
+    parser.add_argument(
+        "--min-confirmations-between-steps",
+        type=int,
+        default=1,
+        help=f"Confirmations required between chained {between} (default: 1)",
+    )
+    parser.add_argument(
+        "--max-wait-seconds",
+        type=float,
+        default=600.0,
+        help="Maximum time to wait for confirmations before aborting (default: 600)",
+    )
+
+
+def _add_plan_pattern_parser(subparsers: argparse._SubParsersAction) -> None:
     pattern_parser = subparsers.add_parser(
         "plan-pattern",
         help="Plan or broadcast an explicit payment pattern",
@@ -833,6 +1133,7 @@ def build_parser() -> argparse.ArgumentParser:
     )
     pattern_parser.add_argument(
         "--fee",
+        type=_decimal_arg,
         default="0.21",
         help="Transaction fee in DGB (default: 0.21)",
     )
@@ -847,28 +1148,11 @@ def build_parser() -> argparse.ArgumentParser:
         default=1,
         help="Minimum confirmations required for funding UTXOs (default: 1)",
     )
-    pattern_parser.add_argument(
-        "--wait-between-txs",
-        type=float,
-        default=0.0,
-        help="Seconds to wait between chained broadcasts or confirmation polls",
-    )
-    pattern_parser.add_argument(
-        "--min-confirmations-between-steps",
-        type=int,
-        default=1,
-        help="Confirmations required between chained steps (default: 1)",
-    )
     pattern_parser.add_argument(
         "--use-utxos",
         help="Comma-separated txid:vout list to fund the pattern (skips automatic selection)",
     )
-    pattern_parser.add_argument(
-        "--max-wait-seconds",
-        type=float,
-        default=600.0,
-        help="Maximum time to wait for confirmations before aborting (default: 600)",
-    )
+    _add_confirmation_pacing_args(pattern_parser)
     pattern_parser.add_argument(
         "--allow-unconfirmed-chain",
         action="store_true",
@@ -886,9 +1170,12 @@ def build_parser() -> argparse.ArgumentParser:
     )
     pattern_parser.add_argument(
         "--auto-prepare-fee",
+        type=_decimal_arg,
         help="Fee in DGB for the auto-prepare transaction (defaults to --fee)",
     )
 
+
+def _add_list_utxos_parser(subparsers: argparse._SubParsersAction) -> None:
     list_utxos_parser = subparsers.add_parser(
         "list-utxos",
         help="Display spendable UTXOs in the active wallet",
@@ -903,6 +1190,11 @@ def build_parser() -> argparse.ArgumentParser:
         "--address",
         help="Optional comma-separated address filter",
     )
+    list_utxos_parser.add_argument(
+        "--min-amount",
+        type=_decimal_arg,
+        help="Only list UTXOs of at least this many DGB (filtered by the node)",
+    )
     list_utxos_parser.add_argument(
         "--json",
         dest="as_json",
@@ -910,6 +1202,8 @@ def build_parser() -> argparse.ArgumentParser:
         help="Emit the raw listunspent JSON",
     )
 
+
+def _add_ord_scan_parser(subparsers: argparse._SubParsersAction) -> None:
     ord_scan_parser = subparsers.add_parser(
         "ord-scan",
         help="Scan a block range for ordinal-style inscription candidates (non-consensus)",
@@ -929,6 +1223,12 @@ def build_parser() -> argparse.ArgumentParser:
         default=50,
         help="Maximum number of candidate outputs to return (default: 50)",
     )
+    ord_scan_parser.add_argument(
+        "--rpc-batch-size",
+        type=int,
+        default=50,
+        help="Blocks fetched per batched JSON-RPC request; 1 disables batching (default: 50)",
+    )
     ord_scan_parser.add_argument(
         "--update-index",
         action="store_true",
@@ -973,6 +1273,8 @@ def build_parser() -> argparse.ArgumentParser:
         help="Emit the scan results as JSON",
     )
 
+
+def _add_ord_index_parser(subparsers: argparse._SubParsersAction) -> None:
     ord_index_parser = subparsers.add_parser(
         "ord-index",
         help="Interact with the local ordinal inscription index",
@@ -1025,6 +1327,8 @@ def build_parser() -> argparse.ArgumentParser:
         "--json", dest="as_json", action="store_true", help="Emit JSON output"
     )
 
+
+def _add_ord_decode_parser(subparsers: argparse._SubParsersAction) -> None:
     ord_decode_parser = subparsers.add_parser(
         "ord-decode",
         help="Decode inscription-style payloads from a transaction (experimental)",
@@ -1051,6 +1355,9 @@ def build_parser() -> argparse.ArgumentParser:
         action="store_true",
         help="Emit decoded payloads as JSON",
     )
+
+
+def _add_ord_plan_op_return_parser(subparsers: argparse._SubParsersAction) -> None:
     ord_plan_op_return_parser = subparsers.add_parser(
         "ord-plan-op-return",
         help="Draft a DigiByte OP_RETURN inscription plan (no broadcast)",
@@ -1075,6 +1382,8 @@ def build_parser() -> argparse.ArgumentParser:
         help="Emit the inscription plan as JSON",
     )
 
+
+def _add_ord_plan_taproot_parser(subparsers: argparse._SubParsersAction) -> None:
     ord_plan_taproot_parser = subparsers.add_parser(
         "ord-plan-taproot",
         help="Draft a DigiByte Taproot inscription plan (no broadcast)",
@@ -1100,6 +1409,8 @@ def build_parser() -> argparse.ArgumentParser:
         help="Emit the inscription plan as JSON",
     )
 
+
+def _add_ord_inscribe_parser(subparsers: argparse._SubParsersAction) -> None:
     ord_inscribe_parser = subparsers.add_parser(
         "ord-inscribe",
         help="Create, sign, and optionally broadcast an inscription (broadcast opt-in)",
@@ -1130,9 +1441,11 @@ def build_parser() -> argparse.ArgumentParser:
     )
     ord_inscribe_parser.add_argument(
         "--postage-dgb",
-        default=str(DUST_LIMIT),
+        type=_decimal_arg,
+        default=_POSTAGE_DGB_DEFAULT,
         help=(
-            "Amount to lock in the Taproot commitment output (default: %(default)s). "
+            "Amount to lock in the Taproot commitment output "
+            f"(default: {_POSTAGE_DGB_DEFAULT}). "
             "Increase this to fund higher-fee reveals."
         ),
     )
@@ -1166,7 +1479,7 @@ def build_parser() -> argparse.ArgumentParser:
         "--max-fee-sats",
         type=int,
         default=250000,
-        help="Abort if the estimated fee exceeds this many satoshis (default: %(default)s)",
+        help="Abort if the estimated fee exceeds this many satoshis (default: 250000)",
     )
     ord_inscribe_parser.add_argument(
         "--fee-rate-satvb",
@@ -1204,6 +1517,8 @@ def build_parser() -> argparse.ArgumentParser:
     )
     ord_inscribe_parser.set_defaults(broadcast=False, rbf=True)
 
+
+def _add_ord_reveal_parser(subparsers: argparse._SubParsersAction) -> None:
     ord_reveal_parser = subparsers.add_parser(
         "ord-reveal",
         help="Spend a taproot commitment output to reveal an inscription",
@@ -1234,6 +1549,7 @@ def build_parser() -> argparse.ArgumentParser:
     )
     ord_reveal_parser.add_argument(
         "--fee",
+        type=_decimal_arg,
         default="0.00001",
         help="Fee paid from the commit output (default: 0.00001 DGB)",
     )
@@ -1243,6 +1559,9 @@ def build_parser() -> argparse.ArgumentParser:
         help="Broadcast the reveal transaction (default: dry-run)",
     )
     ord_reveal_parser.set_defaults(broadcast=False)
+
+
+def _add_ord_wizard_parser(subparsers: argparse._SubParsersAction) -> None:
     ord_wizard_parser = subparsers.add_parser(
         "ord-wizard",
         help="Guided Taproot inscription wizard (interactive or parameterized)",
@@ -1265,9 +1584,11 @@ def build_parser() -> argparse.ArgumentParser:
     )
     ord_wizard_parser.add_argument(
         "--postage-dgb",
-        default=str(DUST_LIMIT),
+        type=_decimal_arg,
+        default=_POSTAGE_DGB_DEFAULT,
         help=(
-            "Amount to lock in the Taproot commitment output (default: %(default)s). "
+            "Amount to lock in the Taproot commitment output "
+            f"(default: {_POSTAGE_DGB_DEFAULT}). "
             "Increase this to fund higher-fee reveals."
         ),
     )
@@ -1305,6 +1626,8 @@ def build_parser() -> argparse.ArgumentParser:
     )
     ord_wizard_parser.set_defaults(broadcast=False)
 
+
+def _add_ord_mine_parser(subparsers: argparse._SubParsersAction) -> None:
     ord_mine_parser = subparsers.add_parser(
         "ord-mine",
         help="Discover ordinal-style inscriptions belonging to a wallet or address set",
@@ -1366,6 +1689,8 @@ def build_parser() -> argparse.ArgumentParser:
         help="Emit discovered inscriptions as JSON",
     )
 
+
+def _add_plan_chain_parser(subparsers: argparse._SubParsersAction) -> None:
     chain_parser = subparsers.add_parser(
         "plan-chain",
         help="Plan or broadcast a chained symbol using dialect frames",
@@ -1410,37 +1735,26 @@ def build_parser() -> argparse.ArgumentParser:
         action="store_true",
         help="Broadcast the chained plan after inspection",
     )
-    chain_parser.add_argument(
-        "--wait-between-txs",
-        type=float,
-        default=0.0,
-        help="Seconds to wait between chained broadcasts or confirmation polls",
-    )
-    chain_parser.add_argument(
-        "--min-confirmations-between-steps",
-        type=int,
-        default=1,
-        help="Confirmations required between chained frames (default: 1)",
-    )
-    chain_parser.add_argument(
-        "--max-wait-seconds",
-        type=float,
-        default=600.0,
-        help="Maximum time to wait for confirmations before aborting (default: 600)",
-    )
+    _add_confirmation_pacing_args(chain_parser, between="frames")
 
+
+def _add_send_sequence_parser(subparsers: argparse._SubParsersAction) -> None:
     send_sequence_parser = subparsers.add_parser(
         "send-sequence",
         help="Send an explicit payment sequence using independent UTXOs",
     )
     _configure_sequence_parser(send_sequence_parser, include_mode_flags=True)
 
+
+def _add_plan_sequence_parser(subparsers: argparse._SubParsersAction) -> None:
     plan_sequence_parser = subparsers.add_parser(
         "plan-sequence",
         help="Inspect a payment sequence without broadcasting",
     )
     _configure_sequence_parser(plan_sequence_parser, include_mode_flags=False)
 
+
+def _add_prepare_utxos_parser(subparsers: argparse._SubParsersAction) -> None:
     prepare_utxos_parser = subparsers.add_parser(
         "prepare-utxos",
         help="Carve new wallet-owned UTXOs for later signaling",
@@ -1452,6 +1766,7 @@ def build_parser() -> argparse.ArgumentParser:
     )
     prepare_utxos_parser.add_argument(
         "--fee",
+        type=_decimal_arg,
         default="0.21",
         help="Transaction fee in DGB (default: 0.21)",
     )
@@ -1471,7 +1786,38 @@ def build_parser() -> argparse.ArgumentParser:
         help="Build the transaction without broadcasting",
     )
 
-    return parser
+
+_SUBPARSER_BUILDERS: dict[str, Callable[[argparse._SubParsersAction], None]] = {
+    "console": _add_console_parser,
+    "quickstart": _add_quickstart_parser,
+    "dialect": _add_dialect_parser,
+    "send-message": _add_send_message_parser,
+    "watch": _add_watch_parser,
+    "dtsp-encode": _add_dtsp_encode_parser,
+    "dtsp-decode": _add_dtsp_decode_parser,
+    "dtsp-table": _add_dtsp_table_parser,
+    "unspendable": _add_unspendable_parser,
+    "unspendable-decode": _add_unspendable_decode_parser,
+    "binary-utxo-encode": _add_binary_utxo_encode_parser,
+    "binary-utxo-decode": _add_binary_utxo_decode_parser,
+    "send-symbol": _add_send_symbol_parser,
+    "plan-symbol": _add_plan_symbol_parser,
+    "plan-pattern": _add_plan_pattern_parser,
+    "list-utxos": _add_list_utxos_parser,
+    "ord-scan": _add_ord_scan_parser,
+    "ord-index": _add_ord_index_parser,
+    "ord-decode": _add_ord_decode_parser,
+    "ord-plan-op-return": _add_ord_plan_op_return_parser,
+    "ord-plan-taproot": _add_ord_plan_taproot_parser,
+    "ord-inscribe": _add_ord_inscribe_parser,
+    "ord-reveal": _add_ord_reveal_parser,
+    "ord-wizard": _add_ord_wizard_parser,
+    "ord-mine": _add_ord_mine_parser,
+    "plan-chain": _add_plan_chain_parser,
+    "send-sequence": _add_send_sequence_parser,
+    "plan-sequence": _add_plan_sequence_parser,
+    "prepare-utxos": _add_prepare_utxos_parser,
+}
 
 
 def _configure_sequence_parser(
@@ -1485,6 +1831,7 @@ def _configure_sequence_parser(
     )
     parser.add_argument(
         "--fee",
+        type=_decimal_arg,
         default="0.21",
         help="Per-transaction fee in DGB (default: 0.21)",
     )
@@ -1498,24 +1845,7 @@ def _configure_sequence_parser(
         "--use-utxos",
         help="Comma-separated txid:vout list to fund the sequence (skips automatic selection)",
     )
-    parser.add_argument(
-        "--wait-between-txs",
-        type=float,
-        default=0.0,
-        help="Seconds to wait between chained broadcasts or confirmation polls",
-    )
-    parser.add_argument(
-        "--min-confirmations-between-steps",
-        type=int,
-        default=1,
-        help="Confirmations required between chained steps (default: 1)",
-    )
-    parser.add_argument(
-        "--max-wait-seconds",
-        type=float,
-        default=600.0,
-        help="Maximum time to wait for confirmations before aborting (default: 600)",
-    )
+    _add_confirmation_pacing_args(parser)
     parser.add_argument(
         "--single-tx",
         action="store_true",
@@ -1548,6 +1878,7 @@ def _configure_sequence_parser(
     )
     parser.add_argument(
         "--auto-prepare-fee",
+        type=_decimal_arg,
         help="Fee in DGB for the auto-prepare transaction (defaults to --fee)",
     )
     if include_mode_flags:
@@ -1561,8 +1892,12 @@ def _configure_sequence_parser(
 
 
 def _parse_payload_json(payload_json: str) -> dict[str, Any]:
+    # The CLI defaults are "{}"; skip the parser for them. A fresh dict is
+    # returned every time because callers pop keys from the result.
+    if not payload_json or payload_json == "{}":
+        return {}
     try:
-        data = json.loads(payload_json) if payload_json else {}
+        data = _loads(payload_json)
     except json.JSONDecodeError as exc:  # pragma: no cover - input validation
         raise CLIError(f"Invalid payload JSON: {exc}") from exc
     if not isinstance(data, dict):
@@ -1574,16 +1909,18 @@ def _parse_amounts_csv(raw: str) -> list[Decimal]:
     parts = _split_csv(raw)
     if not parts:
         raise CLIError("--amounts must include at least one value")
-    amounts: list[Decimal] = []
-    for index, part in enumerate(parts):
-        try:
-            amount = Decimal(part)
-        except InvalidOperation as exc:  # pragma: no cover - input validation
-            raise CLIError(
-                f"Amount #{index + 1} is not a valid decimal value: {part}"
-            ) from exc
-        amounts.append(amount)
-    return amounts
+    try:
+        return [_decimal(part) for part in parts]
+    except InvalidOperation as exc:
+        # Only the failure path pays for locating the offending entry.
+        for index, part in enumerate(parts):
+            try:
+                Decimal(part)
+            except InvalidOperation:
+                raise CLIError(
+                    f"Amount #{index + 1} is not a valid decimal value: {part}"
+                ) from exc
+        raise  # pragma: no cover - every part parsed on the second pass
 
 
 def _parse_utxo_refs(raw: str) -> list[tuple[str, int]]:
@@ -1592,48 +1929,66 @@ def _parse_utxo_refs(raw: str) -> list[tuple[str, int]]:
         raise CLIError("--use-utxos requires at least one txid:vout pair")
     references: list[tuple[str, int]] = []
     for piece in parts:
-        try:
-            txid, vout_str = piece.split(":", maxsplit=1)
-        except ValueError as exc:  # pragma: no cover - input validation
+        match = _UTXO_REF_RE.fullmatch(piece)
+        if match is None:
             raise CLIError(
-                f"Invalid UTXO reference: {piece}. Expected txid:vout"
-            ) from exc
-        try:
-            vout = int(vout_str)
-        except ValueError as exc:  # pragma: no cover - input validation
-            raise CLIError(f"Invalid vout index in UTXO reference: {piece}") from exc
-        references.append((txid, vout))
+                f"Invalid UTXO reference: {piece}. Expected txid:vout with a "
+                "64-character hex txid"
+            )
+        references.append((match.group(1), int(match.group(2))))
     return references
 
 
 def _split_csv(raw: str) -> list[str]:
-    return [segment.strip() for segment in raw.split(",") if segment.strip()]
+    return [segment for segment in map(str.strip, raw.split(",")) if segment]
+
 
+def _decimal_arg(value: str) -> Decimal:
+    """argparse ``type`` for decimal flags such as ``--fee``."""
 
-def _parse_decimal(value: str, flag: str) -> Decimal:
     try:
-        return Decimal(value)
-    except InvalidOperation as exc:  # pragma: no cover - input validation
-        raise CLIError(f"{flag} must be a valid decimal value") from exc
+        return _decimal(value)
+    except InvalidOperation as exc:
+        raise argparse.ArgumentTypeError(f"invalid decimal value: {value!r}") from exc
+
+
+def _memoized_listunspent(rpc: DigiByteRPC) -> Callable[[int], list[dict[str, Any]]]:
+    """Return ``rpc.listunspent`` memoized by confirmation depth.
+
+    ``listunspent`` scales with the wallet's history, so commands that consult
+    it from several helpers share one result per depth. Only use the returned
+    callable within a single command, and not after broadcasting.
+    """
+
+    results: dict[int, list[dict[str, Any]]] = {}
+
+    def listunspent(min_confirmations: int) -> list[dict[str, Any]]:
+        if min_confirmations not in results:
+            results[min_confirmations] = rpc.listunspent(min_confirmations)
+        return results[min_confirmations]
+
+    return listunspent
 
 
 def _load_selected_utxos(
-    rpc: DigiByteRPC, utxo_spec: str | None, min_confirmations: int
+    rpc: DigiByteRPC,
+    utxo_spec: str | None,
+    min_confirmations: int,
+    *,
+    listunspent: Callable[[int], list[dict[str, Any]]] | None = None,
 ) -> list[dict[str, Any]]:
+    from .planner import match_utxo_references
+
     if not utxo_spec:
         return []
     references = _parse_utxo_refs(utxo_spec)
-    available = rpc.listunspent(min_confirmations)
-    indexed = {
-        (entry["txid"], int(entry["vout"])): entry
-        for entry in available
-        if entry.get("spendable", True)
-    }
-    missing = [ref for ref in references if ref not in indexed]
+    selected, missing = match_utxo_references(
+        (listunspent or rpc.listunspent)(min_confirmations), references
+    )
     if missing:
         missing_desc = ", ".join(f"{txid}:{vout}" for txid, vout in missing)
         raise CLIError("Requested UTXOs not found or not spendable: " + missing_desc)
-    return [indexed[ref] for ref in references]
+    return selected
 
 
 def _wait_for_tx_confirmations(
@@ -1643,6 +1998,8 @@ def _wait_for_tx_confirmations(
     max_wait_seconds: float | None,
     progress_callback: Callable[[str], None] | None = None,
 ) -> None:
+    from .rpc_client import RPCError
+
     target_confirmations = max(1, min_confirmations)
     waited = 0.0
     poll_interval = 5.0
@@ -1680,6 +2037,8 @@ def _auto_prepare_utxos(
     max_wait_seconds: float | None,
     progress_callback: Callable[[str], None] | None,
 ) -> list[dict[str, Any]]:
+    from .planner import DUST_LIMIT
+
     buffer_amount = max(DUST_LIMIT, AUTO_PREP_BUFFER)
     funding_confirmations = max(1, min_confirmations)
     targets: list[Decimal] = []
@@ -1723,11 +2082,12 @@ def _ensure_independent_funding(
     selected_utxos: list[dict[str, Any]],
     *,
     auto_prepare: bool,
-    auto_prepare_fee: str | None,
+    auto_prepare_fee: Decimal | None,
     allow_unconfirmed: bool,
     is_dry_run: bool,
     max_wait_seconds: float | None,
     progress_callback: Callable[[str], None] | None,
+    listunspent: Callable[[int], list[dict[str, Any]]] | None = None,
 ) -> list[dict[str, Any]]:
     required = len(amounts)
     if required <= 1:
@@ -1741,7 +2101,7 @@ def _ensure_independent_funding(
         return selected_utxos
 
     count_minconf = min_confirmations if allow_unconfirmed else max(1, min_confirmations)
-    available = rpc.listunspent(count_minconf)
+    available = (listunspent or rpc.listunspent)(count_minconf)
     if len(available) >= required:
         return selected_utxos
 
@@ -1751,11 +2111,7 @@ def _ensure_independent_funding(
             "Run prepare-utxos, add funding, or pass --auto-prepare-utxos."
         )
 
-    prepare_fee = (
-        _parse_decimal(auto_prepare_fee, "--auto-prepare-fee")
-        if auto_prepare_fee
-        else fee
-    )
+    prepare_fee = auto_prepare_fee if auto_prepare_fee is not None else fee
     return _auto_prepare_utxos(
         rpc,
         builder,
@@ -1768,6 +2124,21 @@ def _ensure_independent_funding(
     )
 
 
+def _parse_max_outputs_per_tx(value: int) -> int:
+    """Validate --max-outputs-per-tx, warning above the relay policy limit."""
+
+    if value <= 0:
+        raise CLIError("--max-outputs-per-tx must be positive")
+    if value > POLICY_MAX_OUTPUTS_PER_TX:
+        logger.warning(
+            "--max-outputs-per-tx %d exceeds the ~%d outputs that fit in a "
+            "standard transaction; nodes may refuse to relay it",
+            value,
+            POLICY_MAX_OUTPUTS_PER_TX,
+        )
+    return value
+
+
 def _parse_max_frames(value: int | None) -> int | None:
     """Validate the --max-frames flag shared by the planning commands."""
 
@@ -1778,32 +2149,21 @@ def _parse_max_frames(value: int | None) -> int | None:
     return value
 
 
-def _format_decimal(value: Decimal) -> str:
-    """Format Decimal values with fixed precision for human summaries."""
+def _format_decimal(value: Decimal | float) -> str:
+    """Format amounts with fixed eight-place precision for human summaries.
 
-    return f"{value:.8f}"
+    Float amounts are whole satoshis divided by 1e8, so formatting them
+    directly matches formatting ``Decimal(str(value))``.
+    """
 
-
-def _chunk_instructions(
-    instructions: Sequence[SpendInstruction], max_per_tx: int
-) -> list[list[SpendInstruction]]:
-    if max_per_tx <= 0 or len(instructions) <= max_per_tx:
-        return [list(instructions)] if instructions else []
-    chunks: list[list[SpendInstruction]] = []
-    current: list[SpendInstruction] = []
-    for instruction in instructions:
-        current.append(instruction)
-        if len(current) >= max_per_tx:
-            chunks.append(current)
-            current = []
-    if current:
-        chunks.append(current)
-    return chunks
+    return f"{value:.8f}"
 
 
 def _aggregate_outputs(
     instructions: Iterable[SpendInstruction],
 ) -> tuple[dict[str, float], list[str]]:
+    from .encoder import aggregate_spend_instructions
+
     outputs, op_returns = aggregate_spend_instructions(instructions)
     return outputs, [data.hex() for data in op_returns]
 
@@ -1856,7 +2216,7 @@ def _print_symbol_summary(
         f"Symbol summary for {message.payload.get('symbol', message.intent)} on {message.channel}"
     )
     for address, amount in outputs.items():
-        print(f"  → {_format_decimal(Decimal(str(amount)))} DGB to {address}")
+        print(f"  → {_format_decimal(amount)} DGB to {address}")
     if op_returns:
         for idx, payload in enumerate(op_returns, start=1):
             hint = payload
@@ -1867,7 +2227,7 @@ def _print_symbol_summary(
             except (UnicodeDecodeError, ValueError):  # pragma: no cover - display only
                 hint = payload
             print(f"  OP_RETURN #{idx}: {hint}")
-    print(f"  Fee punctuation: {_format_decimal(Decimal(str(fee)))} DGB")
+    print(f"  Fee punctuation: {_format_decimal(fee)} DGB")
 
 
 def _print_sequence_summary(
@@ -1912,6 +2272,8 @@ def _execute_sequence_plan(
 ) -> list[str]:
     """Legacy helper retained for tests that exercise the previous interface."""
 
+    from .planner import PREVIOUS_CHANGE_SENTINEL
+
     if len(op_returns) != len(plan.steps):
         raise CLIError("OP_RETURN payload count must match the number of transactions")
     previous_change_ref: tuple[str, int] | None = None
@@ -1929,7 +2291,7 @@ def _execute_sequence_plan(
                 )
             else:
                 inputs.append({"txid": entry.txid, "vout": entry.vout})
-        ordered_outputs: OrderedDict[str, float] = OrderedDict()
+        ordered_outputs: dict[str, float] = {}
         for output in step.outputs:
             ordered_outputs[output.address] = float(output.amount)
         change_index: int | None = None
@@ -1956,16 +2318,22 @@ def _execute_sequence_plan(
 
 
 def cmd_dtsp_encode(args: argparse.Namespace) -> None:
+    from .dtsp import DTSP_CONTROL, encode_message_to_dtsp_sequence
+
     include_handshake = args.include_handshake or args.include_accept
     sequence = encode_message_to_dtsp_sequence(
         args.message, include_start_end=include_handshake
     )
     if args.include_accept and sequence:
         sequence.insert(1, DTSP_CONTROL["ACCEPT"])
-    print(",".join(f"{value:.8f}" for value in sequence))
+    # The DTSP alphabet is tiny, so format each distinct code only once.
+    labels = {value: f"{value:.8f}" for value in set(sequence)}
+    print(",".join(map(labels.__getitem__, sequence)))
 
 
 def cmd_dtsp_decode(args: argparse.Namespace) -> None:
+    from .dtsp import closest_dtsp_symbol, decode_dtsp_sequence_to_message
+
     parts = _split_csv(args.amounts)
     if not parts:
         raise CLIError("At least one DTSP amount is required")
@@ -1993,7 +2361,9 @@ def cmd_dtsp_decode(args: argparse.Namespace) -> None:
                 print(f"{value:.8f} → unknown (closest error {error:.2e})")
 
 
-def cmd_dtsp_table() -> None:
+def cmd_dtsp_table(args: argparse.Namespace | None = None) -> None:
+    from .dtsp import format_dtsp_table
+
     print(format_dtsp_table())
 
 
@@ -2023,34 +2393,39 @@ def cmd_unspendable_decode(args: argparse.Namespace) -> None:
 
 
 def cmd_binary_encode(args: argparse.Namespace) -> None:
-    try:
-        base_amount = Decimal(args.base_amount)
-    except InvalidOperation as exc:  # pragma: no cover - argument validation
-        raise CLIError(f"invalid base amount: {args.base_amount}") from exc
+    from .binary_packets import (
+        encode_text_to_binary_packets,
+        format_packets_human_readable,
+    )
+
     packets = encode_text_to_binary_packets(
-        args.message, base_amount=base_amount, bits_per_char=args.bits_per_char
+        args.message, base_amount=args.base_amount, bits_per_char=args.bits_per_char
     )
-    print(format_packets_human_readable(packets))
+    format_packets_human_readable(packets, out=sys.stdout)
     print("amounts:", ",".join(str(packet.amount) for packet in packets))
 
 
 def cmd_binary_decode(args: argparse.Namespace) -> None:
+    from .binary_packets import decode_binary_packets_to_text
+
     amounts = _parse_decimal_list(args.amounts)
-    try:
-        base_amount = Decimal(args.base_amount)
-    except InvalidOperation as exc:  # pragma: no cover - argument validation
-        raise CLIError(f"invalid base amount: {args.base_amount}") from exc
     message = decode_binary_packets_to_text(
-        amounts, base_amount=base_amount, bits_per_char=args.bits_per_char
+        amounts, base_amount=args.base_amount, bits_per_char=args.bits_per_char
     )
     print(message)
 
 
 def cmd_send_message(args: argparse.Namespace) -> None:
+    from datetime import datetime, timezone
+    from uuid import uuid4
+
+    from .encoder import EnigmaticEncoder, iter_spend_batches
+    from .model import EncodingConfig, EnigmaticMessage
+    from .tx_builder import TransactionBuilder
+
+    max_per_tx = _parse_max_outputs_per_tx(args.max_outputs_per_tx)
     payload = _parse_payload_json(args.payload_json)
-    op_return_metadata = (
-        _parse_payload_json(args.op_return_json) if args.op_return_json else {}
-    )
+    op_return_metadata = _parse_payload_json(args.op_return_json)
     message_id = args.message_id
     if not message_id:
         message_id = (
@@ -2061,7 +2436,7 @@ def cmd_send_message(args: argparse.Namespace) -> None:
         op_return_metadata.pop("id", None)
         op_return_metadata.pop("message_id", None)
     if not message_id:
-        message_id = str(uuid4())
+        message_id = uuid4().hex
     message = EnigmaticMessage(
         id=message_id,
         timestamp=datetime.now(timezone.utc),
@@ -2071,9 +2446,9 @@ def cmd_send_message(args: argparse.Namespace) -> None:
     )
 
     rpc = _rpc_client()
-    config = EncodingConfig.enigmatic_default()
+    config = _default_config()
     if args.fee is not None:
-        fee_override = float(_parse_decimal(args.fee, "--fee"))
+        fee_override = float(args.fee)
         config = EncodingConfig(
             anchor_amounts=config.anchor_amounts,
             micro_amounts=config.micro_amounts,
@@ -2090,10 +2465,10 @@ def cmd_send_message(args: argparse.Namespace) -> None:
     if not instructions:
         raise CLIError("Encoder returned no spend instructions")
 
-    plans = []
-    for chunk in _chunk_instructions(instructions, MAX_OUTPUTS_PER_TX):
-        outputs, op_returns = _aggregate_outputs(chunk)
-        plans.append({"outputs": outputs, "op_returns": op_returns})
+    plans = [
+        {"outputs": outputs, "op_returns": [data.hex() for data in op_returns]}
+        for outputs, op_returns in iter_spend_batches(instructions, max_per_tx)
+    ]
 
     if args.dry_run:
         summary = {
@@ -2105,7 +2480,7 @@ def cmd_send_message(args: argparse.Namespace) -> None:
         }
         if op_return_metadata:
             summary["op_return_metadata"] = op_return_metadata
-        print(json.dumps(summary, indent=2))
+        print(_dumps_pretty(summary))
         return
 
     builder = TransactionBuilder(rpc)
@@ -2117,12 +2492,14 @@ def cmd_send_message(args: argparse.Namespace) -> None:
         txids.append(txid)
 
     result = {"message_id": message.id, "txids": txids}
-    print(json.dumps(result, separators=COMPACT_JSON_SEPARATORS))
+    print(_dumps_compact(result))
 
 
 def cmd_watch(args: argparse.Namespace) -> None:
+    from .watcher import Watcher
+
     rpc = _rpc_client()
-    config = EncodingConfig.enigmatic_default()
+    config = _default_config()
     watcher = Watcher(
         rpc,
         addresses=(
@@ -2141,25 +2518,64 @@ def cmd_watch(args: argparse.Namespace) -> None:
         print("RPC connectivity looks good; watcher is configured but not started.")
         return
 
+    # Lines are queued per polling cycle and written with a single write and
+    # flush, rather than one flushed print per message. They stay as encoded
+    # bytes so the write can skip the text layer's str -> UTF-8 pass.
+    pending: list[bytes] = []
+
     def emit(message: EnigmaticMessage) -> None:
         data = {
             "id": message.id,
-            "timestamp": message.timestamp.isoformat(),
+            "timestamp": message.timestamp_iso,
             "channel": message.channel,
             "intent": message.intent,
             "payload": message.payload,
             "encrypted": message.encrypted,
         }
-        print(json.dumps(data, separators=COMPACT_JSON_SEPARATORS))
+        pending.append(_dumps_compact_bytes(data))
+
+    def flush_pending() -> None:
+        stdout = sys.stdout
+        if pending:
+            chunk = b"\n".join(pending) + b"\n"
+            pending.clear()
+            buffer = getattr(stdout, "buffer", None)
+            if buffer is None:  # e.g. stdout replaced by a StringIO
+                stdout.write(chunk.decode("utf-8"))
+            else:
+                stdout.flush()  # keep any earlier text output in order
+                buffer.write(chunk)
+        stdout.flush()
+
+    try:
+        watcher.run_forever(emit, after_poll=flush_pending)
+    finally:
+        flush_pending()
 
-    watcher.run_forever(emit)
+
+def _decode_session_key(raw: str) -> bytes:
+    """Decode a URL-safe base64 session key, tolerating missing padding."""
+
+    import base64
+
+    try:
+        # binascii.Error (bad padding or alphabet) subclasses ValueError, as
+        # does the error for non-ASCII input.
+        return base64.urlsafe_b64decode(raw + "=" * (-len(raw) % 4))
+    except ValueError as exc:
+        raise CLIError("Session key must be valid base64") from exc
 
 
 def cmd_send_symbol(args: argparse.Namespace) -> None:
+    from datetime import datetime, timezone
+
+    from .dialect import load_dialect
+    from .session import SessionContext
+    from .symbol_sender import SessionRequiredError, prepare_symbol_send
+    from .tx_builder import TransactionBuilder
+
     extra_payload = _parse_payload_json(args.extra_payload_json)
-    op_return_metadata = (
-        _parse_payload_json(args.op_return_json) if args.op_return_json else {}
-    )
+    op_return_metadata = _parse_payload_json(args.op_return_json)
     message_id = args.message_id
     if not message_id:
         message_id = (
@@ -2177,10 +2593,7 @@ def cmd_send_symbol(args: argparse.Namespace) -> None:
             raise CLIError(
                 "--session-id is required when --session-key-b64 is provided"
             )
-        try:
-            session_key = base64.urlsafe_b64decode(args.session_key_b64.encode("ascii"))
-        except (binascii.Error, ValueError) as exc:
-            raise CLIError("Session key must be valid base64") from exc
+        session_key = _decode_session_key(args.session_key_b64)
         session_channel = args.session_channel or args.channel
         session_dialect = args.session_dialect or dialect.name
         session = SessionContext(
@@ -2193,7 +2606,7 @@ def cmd_send_symbol(args: argparse.Namespace) -> None:
 
     fee_override = None
     if args.fee is not None:
-        fee_override = float(_parse_decimal(args.fee, "--fee"))
+        fee_override = float(args.fee)
 
     try:
         message, instructions, fee = prepare_symbol_send(
@@ -2224,31 +2637,44 @@ def cmd_send_symbol(args: argparse.Namespace) -> None:
         }
         if op_return_metadata:
             summary["op_return_metadata"] = op_return_metadata
-        print(json.dumps(summary, indent=2))
+        print(_dumps_pretty(summary))
         return
 
     builder = TransactionBuilder(rpc)
     txid = builder.send_payment_tx(outputs, fee, op_return_data=op_returns_hex)
-    print(
-        json.dumps(
-            {"txids": [txid], "message_id": message.id},
-            separators=COMPACT_JSON_SEPARATORS,
-        )
-    )
+    print(_dumps_compact({"txids": [txid], "message_id": message.id}))
 
 
 def cmd_list_utxos(args: argparse.Namespace) -> None:
+    from .rpc_client import RPCError
+
     rpc = _rpc_client()
-    utxos = rpc.listunspent(args.min_confirmations)
-    address_filter = None
-    if getattr(args, "address", None):
-        address_filter = {entry for entry in _split_csv(args.address)}
-        utxos = [u for u in utxos if u.get("address") in address_filter]
+    # Deduplicated and sorted once for both the RPC filter and the header.
+    addresses = sorted(set(_split_csv(getattr(args, "address", None) or "")))
+    min_amount = getattr(args, "min_amount", None)
+    # Let the node filter: large wallets then serialize only matching entries.
+    try:
+        utxos = rpc.listunspent(
+            args.min_confirmations,
+            addresses=addresses or None,
+            query_options=(
+                {"minimumAmount": float(min_amount)} if min_amount is not None else None
+            ),
+        )
+    except RPCError as exc:
+        if not addresses:
+            raise
+        # The node rejects the whole filter over one bad entry; name it if we can.
+        rejected = [address for address in addresses if address in exc.message]
+        raise CLIError(
+            f"Invalid --address {', '.join(rejected or addresses)}: {exc.message}"
+        ) from exc
     if not utxos:
         print("No matching UTXOs found.")
         return
-    ordered = sorted(
-        utxos,
+    # Sort the RPC result in place rather than holding a second wallet-sized list.
+    ordered = utxos
+    ordered.sort(
         key=lambda u: (
             float(u.get("amount", 0)),
             int(u.get("confirmations", 0) or 0),
@@ -2256,15 +2682,11 @@ def cmd_list_utxos(args: argparse.Namespace) -> None:
         reverse=True,
     )
     if getattr(args, "as_json", False):
-        print(json.dumps(ordered, indent=2))
+        _print_json_array(ordered)
         return
     print(
         f"Found {len(ordered)} UTXOs (min_conf={args.min_confirmations})"
-        + (
-            f" filtered by {', '.join(sorted(address_filter))}"
-            if address_filter
-            else ""
-        )
+        + (f" filtered by {', '.join(addresses)}" if addresses else "")
     )
     print(" idx |     amount | conf | spendable | txid:vout | address")
     print(
@@ -2282,6 +2704,8 @@ def cmd_list_utxos(args: argparse.Namespace) -> None:
 
 
 def cmd_ord_scan(args: argparse.Namespace) -> None:
+    from .ordinals import OrdinalIndexer, OrdinalInscriptionDecoder, OrdinalScanConfig
+
     rpc = _rpc_client()
     config = OrdinalScanConfig(
         start_height=args.start_height,
@@ -2289,6 +2713,7 @@ def cmd_ord_scan(args: argparse.Namespace) -> None:
         limit=args.limit,
         include_op_return=args.include_op_return,
         include_taproot_like=args.include_taproot_like,
+        rpc_batch_size=args.rpc_batch_size,
     )
     logger.debug("ord-scan config: %s", config)
     indexer = OrdinalIndexer(rpc)
@@ -2317,20 +2742,15 @@ def cmd_ord_scan(args: argparse.Namespace) -> None:
                     index_updates += 1
 
     if getattr(args, "as_json", False):
-        print(
-            json.dumps(
-                [
-                    {
-                        "txid": location.txid,
-                        "vout": location.vout,
-                        "height": location.height,
-                        "ordinal_hint": location.ordinal_hint,
-                        "tags": sorted(location.tags),
-                    }
-                    for location in locations
-                ],
-                indent=2,
-            )
+        _print_json_array(
+            {
+                "txid": location.txid,
+                "vout": location.vout,
+                "height": location.height,
+                "ordinal_hint": location.ordinal_hint,
+                "tags": sorted(location.tags),
+            }
+            for location in locations
         )
         return
 
@@ -2377,6 +2797,8 @@ def cmd_ord_index(args: argparse.Namespace) -> None:
 
 
 def cmd_ord_mine(args: argparse.Namespace) -> None:
+    from .ordinals import OrdinalOwnershipView, OrdinalScanConfig
+
     rpc = _rpc_client()
     ownership_view = OrdinalOwnershipView(rpc)
     config = OrdinalScanConfig(
@@ -2406,21 +2828,16 @@ def cmd_ord_mine(args: argparse.Namespace) -> None:
         raise CLIError("Provide either --wallet or at least one --address to scan")
 
     if getattr(args, "as_json", False):
-        print(
-            json.dumps(
-                [
-                    {
-                        "height": payload.metadata.location.height,
-                        "txid": payload.metadata.location.txid,
-                        "vout": payload.metadata.location.vout,
-                        "protocol": payload.metadata.protocol,
-                        "content_type": payload.metadata.content_type,
-                        "decoded_text": payload.decoded_text,
-                    }
-                    for payload in payloads
-                ],
-                indent=2,
-            )
+        _print_json_array(
+            {
+                "height": payload.metadata.location.height,
+                "txid": payload.metadata.location.txid,
+                "vout": payload.metadata.location.vout,
+                "protocol": payload.metadata.protocol,
+                "content_type": payload.metadata.content_type,
+                "decoded_text": payload.decoded_text,
+            }
+            for payload in payloads
         )
         return
 
@@ -2457,6 +2874,9 @@ def cmd_ord_mine(args: argparse.Namespace) -> None:
 
 
 def cmd_ord_decode(args: argparse.Namespace) -> None:
+    from .ordinals import OrdinalInscriptionDecoder
+    from .rpc_client import RPCError
+
     rpc = _rpc_client()
     decoder = OrdinalInscriptionDecoder(rpc)
     logger.debug("ord-decode tx=%s vout=%s", args.txid, args.vout)
@@ -2499,7 +2919,7 @@ def cmd_ord_decode(args: argparse.Namespace) -> None:
             if args.raw:
                 entry["raw_hex"] = payload.raw_payload.hex()
             output.append(entry)
-        print(json.dumps(output, indent=2))
+        print(_dumps_pretty(output))
         return
 
     for payload in payloads:
@@ -2518,13 +2938,16 @@ def cmd_ord_decode(args: argparse.Namespace) -> None:
             print(f"  decoded_text: {preview}")
         if payload.decoded_json is not None:
             print(
-                f"  decoded_json: {json.dumps(payload.decoded_json, separators=COMPACT_JSON_SEPARATORS)}"
+                f"  decoded_json: {_COMPACT_ENCODER.encode(payload.decoded_json)}"
             )
         if args.raw:
             print(f"  raw_hex: {payload.raw_payload.hex()}")
 
 
 def cmd_ord_plan_op_return(args: argparse.Namespace) -> None:
+    from .ordinals import OrdinalInscriptionPlanner
+    from .tx_builder import TransactionBuilder
+
     rpc = _rpc_client()
 
     metadata_blob = None
@@ -2541,7 +2964,7 @@ def cmd_ord_plan_op_return(args: argparse.Namespace) -> None:
     plan = planner.plan_op_return_inscription(args.message, metadata=metadata_blob)
 
     if getattr(args, "as_json", False):
-        print(json.dumps(plan, indent=2))
+        print(_dumps_pretty(plan))
         return
 
     metadata = plan.get("metadata", {})
@@ -2565,6 +2988,9 @@ def cmd_ord_plan_op_return(args: argparse.Namespace) -> None:
 
 
 def cmd_ord_plan_taproot(args: argparse.Namespace) -> None:
+    from .ordinals import OrdinalInscriptionPlanner
+    from .tx_builder import TransactionBuilder
+
     rpc = _rpc_client()
 
     planner = OrdinalInscriptionPlanner(
@@ -2593,7 +3019,7 @@ def cmd_ord_plan_taproot(args: argparse.Namespace) -> None:
         raise CLIError(f"Failed to plan Taproot inscription: {exc}") from exc
 
     if getattr(args, "as_json", False):
-        print(json.dumps(plan, indent=2))
+        print(_dumps_pretty(plan))
         return
 
     metadata = plan.get("metadata", {})
@@ -2618,6 +3044,23 @@ def cmd_ord_plan_taproot(args: argparse.Namespace) -> None:
 
 
 def cmd_ord_inscribe(args: argparse.Namespace) -> None:
+    from .fees import (
+        calculate_fee_sats,
+        DEFAULT_CONF_TARGET,
+        DEFAULT_ESTIMATE_MODE,
+        format_floors_for_log,
+        sat_vb_to_dgb_per_kvb,
+        select_fee_rate,
+    )
+    from .ordinals import OrdinalInscriptionPlanner
+    from .ordinals.taproot_builder import (
+        compute_taproot_output_from_script,
+        create_taproot_address,
+    )
+    from .planner import DUST_LIMIT
+    from .rpc_client import RPCError, format_rpc_hint
+    from .tx_builder import TransactionBuilder
+
     rpc = _rpc_client()
     builder = TransactionBuilder(rpc)
     planner = OrdinalInscriptionPlanner(rpc, tx_builder=builder)
@@ -2630,7 +3073,7 @@ def cmd_ord_inscribe(args: argparse.Namespace) -> None:
     metadata = {"content_type": args.content_type}
     postage = None
     if args.scheme == "taproot":
-        postage = _parse_decimal(args.postage_dgb, "--postage-dgb")
+        postage = args.postage_dgb
         if postage <= 0:
             raise CLIError("--postage-dgb must be a positive amount")
         if postage < DUST_LIMIT:
@@ -2807,6 +3250,9 @@ def cmd_ord_inscribe(args: argparse.Namespace) -> None:
 
 
 def cmd_ord_reveal(args: argparse.Namespace) -> None:
+    from .ordinals.reveal import build_taproot_reveal_tx, TaprootRevealError
+    from .rpc_client import RPCError, format_rpc_hint
+
     rpc = _rpc_client()
     payload = _parse_inscription_message(args.message)
     if not payload:
@@ -2871,7 +3317,7 @@ def _resolve_wizard_payload(args: argparse.Namespace) -> tuple[bytes, str]:
             parsed = json.loads(args.payload_json)
         except json.JSONDecodeError as exc:
             raise CLIError(f"invalid JSON for --payload-json: {exc}") from exc
-        payload = json.dumps(parsed, separators=COMPACT_JSON_SEPARATORS).encode("utf-8")
+        payload = _COMPACT_ENCODER.encode(parsed).encode("utf-8")
         return payload, args.content_type or "application/json"
     if args.message is not None:
         return args.message.encode("utf-8"), args.content_type or "text/plain"
@@ -2881,6 +3327,16 @@ def _resolve_wizard_payload(args: argparse.Namespace) -> tuple[bytes, str]:
 
 
 def cmd_ord_wizard(args: argparse.Namespace) -> None:
+    from datetime import datetime, timezone
+
+    from .ordinals.workflows import (
+        compute_taproot_envelope_stats,
+        prepare_inscription_transaction,
+        suggest_max_fee_sats,
+        write_receipt,
+    )
+    from .planner import DUST_LIMIT
+
     if all(
         option is None
         for option in (
@@ -2913,7 +3369,7 @@ def cmd_ord_wizard(args: argparse.Namespace) -> None:
             "Taproot single script element exceeds 520 bytes; shorten payload or use --scheme op-return."
         )
 
-    postage = _parse_decimal(args.postage_dgb, "--postage-dgb")
+    postage = args.postage_dgb
     if postage <= 0:
         raise CLIError("--postage-dgb must be a positive amount")
     if postage < DUST_LIMIT:
@@ -2957,7 +3413,7 @@ def cmd_ord_wizard(args: argparse.Namespace) -> None:
         )
 
     summary = prepared.summary()
-    print(json.dumps(summary, indent=2))
+    print(_dumps_pretty(summary))
     if prepared.txid:
         receipt_path = (
             Path("./receipts")
@@ -2978,6 +3434,8 @@ def cmd_ord_wizard(args: argparse.Namespace) -> None:
 
 
 def cmd_plan_symbol(args: argparse.Namespace) -> None:
+    from .planner import AutomationDialect, SymbolPlanner
+
     dialect = AutomationDialect.load(args.dialect_path)
     rpc = _rpc_client(
         {
@@ -2995,28 +3453,39 @@ def cmd_plan_symbol(args: argparse.Namespace) -> None:
             max_frames=max_frames,
             block_target=args.block_target,
         )
-        print(json.dumps(chain.to_jsonable(), indent=2))
+        print(_dumps_pretty(chain.to_jsonable()))
         if args.broadcast:
             txids = planner.broadcast_chain(chain)
-            print(json.dumps({"txids": txids}, separators=COMPACT_JSON_SEPARATORS))
+            print(_dumps_compact({"txids": txids}))
     else:
         plan = planner.plan(
             symbol,
             receiver=args.receiver_address,
             block_target=args.block_target,
         )
-        print(json.dumps(plan.to_jsonable(), indent=2))
+        print(_dumps_pretty(plan.to_jsonable()))
         if args.broadcast:
             txid = planner.broadcast(plan)
-            print(json.dumps({"txid": txid}, separators=COMPACT_JSON_SEPARATORS))
+            print(_dumps_compact({"txid": txid}))
 
 
 def cmd_plan_pattern(args: argparse.Namespace) -> None:
+    from .planner import (
+        broadcast_pattern_plan,
+        plan_explicit_pattern,
+        plan_independent_pattern,
+    )
+    from .tx_builder import TransactionBuilder
+
     amounts = _parse_amounts_csv(args.amounts)
-    fee = _parse_decimal(args.fee, "--fee")
+    fee = args.fee
     rpc = _rpc_client()
+    listunspent = _memoized_listunspent(rpc)
     selected_utxos = _load_selected_utxos(
-        rpc, getattr(args, "use_utxos", None), args.min_confirmations
+        rpc,
+        getattr(args, "use_utxos", None),
+        args.min_confirmations,
+        listunspent=listunspent,
     )
     builder = TransactionBuilder(rpc)
     if args.broadcast and not args.chained:
@@ -3032,7 +3501,8 @@ def cmd_plan_pattern(args: argparse.Namespace) -> None:
             allow_unconfirmed=args.allow_unconfirmed_chain,
             is_dry_run=not args.broadcast,
             max_wait_seconds=args.max_wait_seconds,
-            progress_callback=_stdout_progress,
+            progress_callback=print,
+            listunspent=listunspent,
         )
     planner_fn = plan_explicit_pattern if args.chained else plan_independent_pattern
     plan = planner_fn(
@@ -3042,9 +3512,12 @@ def cmd_plan_pattern(args: argparse.Namespace) -> None:
         fee=fee,
         min_confirmations=args.min_confirmations,
         preferred_utxos=selected_utxos or None,
+        available_utxos=(
+            None if selected_utxos else listunspent(args.min_confirmations)
+        ),
         allow_unconfirmed_chain=args.allow_unconfirmed_chain,
     )
-    print(json.dumps(plan.to_jsonable(), indent=2))
+    print(_dumps_pretty(plan.to_jsonable()))
     if args.broadcast:
         txids = broadcast_pattern_plan(
             rpc,
@@ -3052,14 +3525,16 @@ def cmd_plan_pattern(args: argparse.Namespace) -> None:
             wait_between_txs=args.wait_between_txs,
             min_confirmations_between_steps=args.min_confirmations_between_steps,
             max_wait_seconds=args.max_wait_seconds,
-            progress_callback=_stdout_progress,
+            progress_callback=print,
         )
-        print(json.dumps({"txids": txids}, separators=COMPACT_JSON_SEPARATORS))
+        print(_dumps_compact({"txids": txids}))
 
 
 def cmd_prepare_utxos(args: argparse.Namespace) -> None:
+    from .tx_builder import TransactionBuilder
+
     amounts = _parse_amounts_csv(args.amounts)
-    fee = _parse_decimal(args.fee, "--fee")
+    fee = args.fee
     rpc = _rpc_client()
     selected_utxos = _load_selected_utxos(
         rpc, getattr(args, "use_utxos", None), args.min_confirmations
@@ -3092,16 +3567,18 @@ def cmd_prepare_utxos(args: argparse.Namespace) -> None:
         ]
     if args.dry_run:
         result["hex"] = signed_hex
-        print(json.dumps(result, indent=2))
+        print(_dumps_pretty(result))
         return
     txid = rpc.sendrawtransaction(signed_hex)
     result["txid"] = txid
-    print(json.dumps(result, separators=COMPACT_JSON_SEPARATORS))
+    print(_dumps_compact(result))
 
 
 def cmd_plan_chain(args: argparse.Namespace) -> None:
     """Plan or broadcast a chained symbol defined in an automation dialect."""
 
+    from .planner import AutomationDialect, SymbolPlanner
+
     dialect = AutomationDialect.load(args.dialect_path)
     rpc = _rpc_client(
         {
@@ -3120,28 +3597,39 @@ def cmd_plan_chain(args: argparse.Namespace) -> None:
         block_target=args.block_target,
     )
     _print_chain_summary(chain)
-    print(json.dumps(chain.to_jsonable(), indent=2))
+    print(_dumps_pretty(chain.to_jsonable()))
     if args.broadcast:
         txids = planner.broadcast_chain(
             chain,
             wait_between_txs=args.wait_between_txs,
             min_confirmations_between_steps=args.min_confirmations_between_steps,
             max_wait_seconds=args.max_wait_seconds,
-            progress_callback=_stdout_progress,
+            progress_callback=print,
         )
-        print(json.dumps({"txids": txids}, separators=COMPACT_JSON_SEPARATORS))
+        print(_dumps_compact({"txids": txids}))
 
 
 def cmd_send_sequence(args: argparse.Namespace) -> None:
+    from .planner import (
+        broadcast_pattern_plan,
+        plan_explicit_pattern,
+        plan_independent_pattern,
+    )
+    from .tx_builder import TransactionBuilder
+
     amounts = _parse_amounts_csv(args.amounts)
-    fee = _parse_decimal(args.fee, "--fee")
+    fee = args.fee
     op_returns = _parse_op_return_args(
         args.op_return_hex, args.op_return_ascii, len(amounts)
     )
     is_dry_run = getattr(args, "dry_run", False) or args.command == "plan-sequence"
     rpc = _rpc_client()
+    listunspent = _memoized_listunspent(rpc)
     selected_utxos = _load_selected_utxos(
-        rpc, getattr(args, "use_utxos", None), args.min_confirmations
+        rpc,
+        getattr(args, "use_utxos", None),
+        args.min_confirmations,
+        listunspent=listunspent,
     )
     builder = TransactionBuilder(rpc)
     if not args.chained and not args.single_tx:
@@ -3157,7 +3645,8 @@ def cmd_send_sequence(args: argparse.Namespace) -> None:
             allow_unconfirmed=args.allow_unconfirmed_chain,
             is_dry_run=is_dry_run,
             max_wait_seconds=args.max_wait_seconds,
-            progress_callback=_stdout_progress,
+            progress_callback=print,
+            listunspent=listunspent,
         )
     planner_fn = plan_explicit_pattern if args.chained else plan_independent_pattern
     plan = planner_fn(
@@ -3167,11 +3656,14 @@ def cmd_send_sequence(args: argparse.Namespace) -> None:
         fee=fee,
         min_confirmations=args.min_confirmations,
         preferred_utxos=selected_utxos or None,
+        available_utxos=(
+            None if selected_utxos else listunspent(args.min_confirmations)
+        ),
         allow_unconfirmed_chain=args.allow_unconfirmed_chain or args.single_tx,
     )
     if is_dry_run:
         _print_sequence_summary(plan, op_returns)
-        print(json.dumps(plan.to_jsonable(), indent=2))
+        print(_dumps_pretty(plan.to_jsonable()))
         return
     txids = broadcast_pattern_plan(
         rpc,
@@ -3181,11 +3673,11 @@ def cmd_send_sequence(args: argparse.Namespace) -> None:
         min_confirmations_between_steps=args.min_confirmations_between_steps,
         min_confirmations=args.min_confirmations,
         max_wait_seconds=args.max_wait_seconds,
-        progress_callback=_stdout_progress,
+        progress_callback=print,
         builder=builder,
         single_tx=args.single_tx,
     )
-    print(json.dumps({"txids": txids}, separators=COMPACT_JSON_SEPARATORS))
+    print(_dumps_compact({"txids": txids}))
 
 
 def _print_chain_summary(plan: PlannedChain) -> None:
@@ -3211,24 +3703,31 @@ def _print_chain_summary(plan: PlannedChain) -> None:
 def _format_script_plane(script_plane: ScriptPlane | None) -> str:
     if script_plane is None:
         return "legacy"
-    parts = [script_plane.script_type]
-    if script_plane.taproot_mode:
-        parts.append(script_plane.taproot_mode)
-    descriptor = "/".join(parts)
+    descriptor = (
+        f"{script_plane.script_type}/{script_plane.taproot_mode}"
+        if script_plane.taproot_mode
+        else script_plane.script_type
+    )
     if script_plane.branch_id is not None:
-        descriptor += f" branch {script_plane.branch_id}"
+        descriptor = f"{descriptor} branch {script_plane.branch_id}"
     aggregation = script_plane.aggregation
     if aggregation and not aggregation.is_default():
-        agg_parts = [aggregation.aggregation_mode]
-        if aggregation.signer_set_id:
-            agg_parts.append(str(aggregation.signer_set_id))
-        if aggregation.threshold is not None and aggregation.total_signers is not None:
-            agg_parts.append(f"{aggregation.threshold}/{aggregation.total_signers}")
-        elif aggregation.threshold is not None:
-            agg_parts.append(f"threshold={aggregation.threshold}")
-        elif aggregation.total_signers is not None:
-            agg_parts.append(f"m={aggregation.total_signers}")
-        descriptor += " agg " + " ".join(agg_parts)
+        # Fixed arity, so build the suffix directly rather than via a list join.
+        signer_set = (
+            f" {aggregation.signer_set_id}" if aggregation.signer_set_id else ""
+        )
+        threshold, total = aggregation.threshold, aggregation.total_signers
+        if threshold is not None and total is not None:
+            signers = f" {threshold}/{total}"
+        elif threshold is not None:
+            signers = f" threshold={threshold}"
+        elif total is not None:
+            signers = f" m={total}"
+        else:
+            signers = ""
+        descriptor = (
+            f"{descriptor} agg {aggregation.aggregation_mode}{signer_set}{signers}"
+        )
     return descriptor
 
 
@@ -3238,10 +3737,6 @@ def _preview_text(value: str, limit: int = 120) -> str:
     return value[:limit] + "…"
 
 
-def _stdout_progress(message: str) -> None:
-    print(message)
-
-
 def _parse_inscription_message(raw_message: str) -> bytes:
     """Interpret the inscription message as UTF-8 or hex."""
 
@@ -3267,6 +3762,8 @@ def _extract_output_addresses(verbose_tx: dict) -> dict[int, str | None]:
 
 
 def _get_index_store(args: argparse.Namespace) -> SQLiteOrdinalIndexStore:
+    from .ordinals.index_store import SQLiteOrdinalIndexStore
+
     return SQLiteOrdinalIndexStore(args.index_path)
 
 
@@ -3286,7 +3783,7 @@ def _index_payload_to_dict(payload: InscriptionPayload) -> dict:
 
 def _print_index_payloads(payloads: list[InscriptionPayload], as_json: bool) -> None:
     if as_json:
-        print(json.dumps([_index_payload_to_dict(p) for p in payloads], indent=2))
+        _print_json_array(_index_payload_to_dict(p) for p in payloads)
         return
 
     if not payloads:
@@ -3487,7 +3984,7 @@ def _prompt_decimal_sequence(prompt: str, allow_empty: bool = False) -> list[Dec
         if not raw and allow_empty:
             return []
         try:
-            return [Decimal(piece.strip()) for piece in raw.split(",") if piece.strip()]
+            return [_decimal(piece) for piece in _split_csv(raw)]
         except InvalidOperation:
             print("Please provide a comma-separated list of numbers.")
 
@@ -3554,10 +4051,79 @@ def cmd_dialect_generate(args: argparse.Namespace) -> None:
     print(f"Wrote dialect template to {output_path}")
 
 
+def _reported_error_types() -> tuple[type[Exception], ...]:
+    """Return the exception types ``main`` reports as a one-line error.
+
+    Resolved only once a command has failed so that startup never imports
+    modules just for their exception classes. ``CLIError``,
+    ``ConfigurationError``, ``RPCError``, ``RPCTransportError``,
+    ``DialectError`` and ``PlanningError`` all derive from ``RuntimeError``.
+    """
+
+    from .binary_packets import BinaryEncodingError
+    from .dtsp import DTSPEncodingError
+
+    return (RuntimeError, BinaryEncodingError, DTSPEncodingError)
+
+
+def cmd_console(args: argparse.Namespace) -> None:
+    from .console import console_main
+
+    console_main()
+
+
+def cmd_dialect(args: argparse.Namespace) -> None:
+    if args.dialect_command == "list":
+        cmd_dialect_list(args)
+    elif args.dialect_command == "validate":
+        cmd_dialect_validate(args)
+    elif args.dialect_command == "generate":
+        cmd_dialect_generate(args)
+    else:  # pragma: no cover - argparse enforces choices
+        raise CLIError(f"Unknown dialect subcommand: {args.dialect_command}")
+
+
+_COMMANDS: dict[str, Callable[[argparse.Namespace], None]] = {
+    "console": cmd_console,
+    "quickstart": cmd_quickstart,
+    "dialect": cmd_dialect,
+    "send-message": cmd_send_message,
+    "watch": cmd_watch,
+    "dtsp-encode": cmd_dtsp_encode,
+    "dtsp-decode": cmd_dtsp_decode,
+    "dtsp-table": cmd_dtsp_table,
+    "unspendable": cmd_unspendable,
+    "unspendable-decode": cmd_unspendable_decode,
+    "binary-utxo-encode": cmd_binary_encode,
+    "binary-utxo-decode": cmd_binary_decode,
+    "list-utxos": cmd_list_utxos,
+    "ord-scan": cmd_ord_scan,
+    "ord-index": cmd_ord_index,
+    "ord-mine": cmd_ord_mine,
+    "ord-decode": cmd_ord_decode,
+    "ord-plan-op-return": cmd_ord_plan_op_return,
+    "ord-plan-taproot": cmd_ord_plan_taproot,
+    "ord-inscribe": cmd_ord_inscribe,
+    "ord-reveal": cmd_ord_reveal,
+    "ord-wizard": cmd_ord_wizard,
+    "send-symbol": cmd_send_symbol,
+    "plan-symbol": cmd_plan_symbol,
+    "plan-pattern": cmd_plan_pattern,
+    "prepare-utxos": cmd_prepare_utxos,
+    "plan-chain": cmd_plan_chain,
+    "send-sequence": cmd_send_sequence,
+    "plan-sequence": cmd_send_sequence,
+}
+
+
 def main(argv: Sequence[str] | None = None) -> None:
-    parser = build_parser()
+    command = _requested_command(argv)
+    parser = build_parser(command) if command else _build_overview_parser()
     args = parser.parse_args(argv)
 
+    # Configured here rather than at import so library users keep their own
+    # logging setup; basicConfig is a no-op once the root logger has handlers.
+    logging.basicConfig(level=logging.INFO)
     logging.getLogger().setLevel(
         logging.DEBUG if getattr(args, "verbose", False) else logging.INFO
     )
@@ -3565,86 +4131,15 @@ def main(argv: Sequence[str] | None = None) -> None:
         logger.debug("Verbose logging enabled; log level set to DEBUG")
     set_default_config_path(getattr(args, "config", None))
     try:
-        if args.command == "console":
-            from .console import console_main
-
-            console_main()
-        elif args.command == "quickstart":
-            cmd_quickstart(args)
-        elif args.command == "dialect":
-            if args.dialect_command == "list":
-                cmd_dialect_list(args)
-            elif args.dialect_command == "validate":
-                cmd_dialect_validate(args)
-            elif args.dialect_command == "generate":
-                cmd_dialect_generate(args)
-            else:  # pragma: no cover - argparse enforces choices
-                raise CLIError(f"Unknown dialect subcommand: {args.dialect_command}")
-        elif args.command == "send-message":
-            cmd_send_message(args)
-        elif args.command == "watch":
-            cmd_watch(args)
-        elif args.command == "dtsp-encode":
-            cmd_dtsp_encode(args)
-        elif args.command == "dtsp-decode":
-            cmd_dtsp_decode(args)
-        elif args.command == "dtsp-table":
-            cmd_dtsp_table()
-        elif args.command == "unspendable":
-            cmd_unspendable(args)
-        elif args.command == "unspendable-decode":
-            cmd_unspendable_decode(args)
-        elif args.command == "binary-utxo-encode":
-            cmd_binary_encode(args)
-        elif args.command == "binary-utxo-decode":
-            cmd_binary_decode(args)
-        elif args.command == "list-utxos":
-            cmd_list_utxos(args)
-        elif args.command == "ord-scan":
-            cmd_ord_scan(args)
-        elif args.command == "ord-index":
-            cmd_ord_index(args)
-        elif args.command == "ord-mine":
-            cmd_ord_mine(args)
-        elif args.command == "ord-decode":
-            cmd_ord_decode(args)
-        elif args.command == "ord-plan-op-return":
-            cmd_ord_plan_op_return(args)
-        elif args.command == "ord-plan-taproot":
-            cmd_ord_plan_taproot(args)
-        elif args.command == "ord-inscribe":
-            cmd_ord_inscribe(args)
-        elif args.command == "ord-reveal":
-            cmd_ord_reveal(args)
-        elif args.command == "ord-wizard":
-            cmd_ord_wizard(args)
-        elif args.command == "send-symbol":
-            cmd_send_symbol(args)
-        elif args.command == "plan-symbol":
-            cmd_plan_symbol(args)
-        elif args.command == "plan-pattern":
-            cmd_plan_pattern(args)
-        elif args.command == "prepare-utxos":
-            cmd_prepare_utxos(args)
-        elif args.command == "plan-chain":
-            cmd_plan_chain(args)
-        elif args.command in {"send-sequence", "plan-sequence"}:
-            cmd_send_sequence(args)
-        else:  # pragma: no cover - argparse enforces choices
+        handler = _COMMANDS.get(args.command)
+        if handler is None:  # pragma: no cover - argparse enforces choices
             raise CLIError(f"Unknown command: {args.command}")
+        handler(args)
     except KeyboardInterrupt:  # pragma: no cover - interactive use
         logger.info("Interrupted by user")
-    except (
-        CLIError,
-        ConfigurationError,
-        RPCError,
-        RPCTransportError,
-        RuntimeError,
-        DialectError,
-        PlanningError,
-        BinaryEncodingError,
-        DTSPEncodingError,
-    ) as exc:
+    except Exception as exc:
+        if not isinstance(exc, _reported_error_types()):
+            raise
         logger.error(
             "Command failed: %s", exc, exc_info=logger.isEnabledFor(logging.DEBUG)
         )
@@ -3652,4 +4147,4 @@ def main(argv: Sequence[str] | None = None) -> None:
 
 
 if __name__ == "__main__":
-    main(sys.argv[1:])
+    main()
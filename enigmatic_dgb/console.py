@@ -806,7 +806,7 @@ def handle_decode_watch() -> None:
             watcher = Watcher(rpc, addresses=addresses, config=config)
             watcher.run_forever(
                 lambda msg: print(
-                    f"[{msg.timestamp.isoformat()}] {msg.channel} {msg.intent} -> {msg.payload}"
+                    f"[{msg.timestamp_iso}] {msg.channel} {msg.intent} -> {msg.payload}"
                 )
             )
         except Exception as exc:
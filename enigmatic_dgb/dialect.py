@@ -8,8 +8,10 @@ AEAD helpers elsewhere in the package.
 
 from __future__ import annotations
 
+import copy
 import logging
 from dataclasses import dataclass, field
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
@@ -19,6 +21,9 @@ from .script_plane import ScriptPlane, parse_script_plane_block
 
 logger = logging.getLogger(__name__)
 
+# libyaml's C loader when PyYAML was built with it; same safe-load semantics.
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
 
 class DialectError(RuntimeError):
     """Raised when a dialect file is missing required information."""
@@ -63,8 +68,9 @@ def load_dialect(path: str | Path) -> Dialect:
     if not path.exists():
         raise DialectError(f"Dialect file does not exist: {path}")
 
+    stat = path.stat()
     try:
-        data = yaml.safe_load(path.read_text())
+        data = _parse_dialect_yaml(str(path.resolve()), stat.st_mtime_ns, stat.st_size)
     except yaml.YAMLError as exc:  # pragma: no cover - PyYAML handles details
         raise DialectError(f"Failed to parse dialect YAML: {exc}") from exc
 
@@ -125,7 +131,7 @@ def load_dialect(path: str | Path) -> Dialect:
             anchors=anchors,
             micros=micros,
             intent=intent,
-            metadata=dict(metadata),
+            metadata=copy.deepcopy(metadata),
             script_plane=script_plane,
             dialect_name=name,
             requires_session=requires_session,
@@ -142,6 +148,17 @@ def load_dialect(path: str | Path) -> Dialect:
     return dialect
 
 
+@lru_cache(maxsize=32)
+def _parse_dialect_yaml(path: str, mtime_ns: int, size: int) -> Any:
+    """Parse a dialect file, memoized per path and on-disk version.
+
+    ``mtime_ns`` and ``size`` only key the cache so edits are picked up. The
+    returned document is shared between calls and must not be mutated.
+    """
+
+    return yaml.load(Path(path).read_text(), Loader=_YAML_LOADER)
+
+
 def _require_str(data: dict[str, Any], key: str, error: str) -> str:
     value = data.get(key)
     if not isinstance(value, str) or not value.strip():
@@ -12,6 +12,7 @@ helpers are pure and can be reused for amount-plane encodings as well.
 
 from __future__ import annotations
 
+from bisect import bisect_left
 from typing import Dict, Iterable, List, Tuple
 
 # Core tolerance for floating-point comparisons when matching DTSP codes.
@@ -59,6 +60,15 @@ DTSP_ALPHABET: Dict[str, float] = {
 }
 
 
+# Codes sorted by value (ties broken by alphabet order) so a lookup only has
+# to compare the two neighbours of the insertion point.
+_SORTED_CODES: List[Tuple[float, int, str]] = sorted(
+    (target, order, symbol)
+    for order, (symbol, target) in enumerate(DTSP_ALPHABET.items())
+)
+_SORTED_TARGETS: List[float] = [target for target, _, _ in _SORTED_CODES]
+
+
 class DTSPEncodingError(ValueError):
     """Raised when DTSP encoding or decoding fails."""
 
@@ -84,12 +94,16 @@ def closest_dtsp_symbol(
     """
 
     closest_symbol: str | None = None
+    closest_order = len(_SORTED_CODES)
     min_error = float("inf")
-    for symbol, target in DTSP_ALPHABET.items():
+    index = bisect_left(_SORTED_TARGETS, value)
+    for target, order, symbol in _SORTED_CODES[max(index - 1, 0) : index + 1]:
         error = abs(value - target)
-        if error < min_error:
+        # Equal errors keep the earlier alphabet entry, as a linear scan would.
+        if error < min_error or (error == min_error and order < closest_order):
             min_error = error
             closest_symbol = symbol
+            closest_order = order
     if min_error <= tolerance:
         return closest_symbol, min_error
     return None, min_error
@@ -3,12 +3,11 @@
 from __future__ import annotations
 
 import logging
-from collections import defaultdict
 from dataclasses import dataclass
 from datetime import datetime, timezone
 import hashlib
 import json
-from typing import Any, Iterable, Tuple
+from typing import Any, Iterable, Iterator, Tuple
 from uuid import uuid4
 
 from .dialect import DialectSymbol
@@ -22,6 +21,7 @@ from .model import (
 logger = logging.getLogger(__name__)
 
 OP_RETURN_MAX_BYTES = 80
+SATOSHIS_PER_DGB = 10**8
 
 
 @dataclass
@@ -43,18 +43,50 @@ class SpendInstruction:
 def aggregate_spend_instructions(
     instructions: Iterable["SpendInstruction"],
 ) -> Tuple[dict[str, float], list[bytes]]:
-    """Group spend instructions by address and collect OP_RETURN payloads."""
+    """Group spend instructions by address and collect OP_RETURN payloads.
 
-    outputs: dict[str, float] = defaultdict(float)
+    Amounts are summed as integer satoshis so repeated outputs to the same
+    address do not accumulate floating point drift.
+    """
+
+    for batch in iter_spend_batches(instructions, 0):
+        return batch
+    return {}, []
+
+
+def iter_spend_batches(
+    instructions: Iterable["SpendInstruction"], max_per_batch: int
+) -> Iterator[Tuple[dict[str, float], list[bytes]]]:
+    """Aggregate consecutive batches of at most ``max_per_batch`` instructions.
+
+    Each yielded pair matches :func:`aggregate_spend_instructions` for one
+    batch, but the instructions are consumed in a single pass without first
+    being split into intermediate lists. A non-positive ``max_per_batch``
+    aggregates everything into one batch.
+    """
+
+    satoshis: dict[str, int] = {}
     op_returns: list[bytes] = []
+    count = 0
     for instruction in instructions:
         if instruction.op_return_data:
             op_returns.append(instruction.op_return_data)
-            continue
-        if not instruction.to_address:
-            raise ValueError("Spend instruction is missing a destination address")
-        outputs[instruction.to_address] += instruction.amount
-    return dict(outputs), op_returns
+        else:
+            address = instruction.to_address
+            if not address:
+                raise ValueError("Spend instruction is missing a destination address")
+            amount_sats = int(round(instruction.amount * SATOSHIS_PER_DGB))
+            satoshis[address] = satoshis.get(address, 0) + amount_sats
+        count += 1
+        if count == max_per_batch:
+            yield _satoshis_to_outputs(satoshis), op_returns
+            satoshis, op_returns, count = {}, [], 0
+    if count:
+        yield _satoshis_to_outputs(satoshis), op_returns
+
+
+def _satoshis_to_outputs(satoshis: dict[str, int]) -> dict[str, float]:
+    return {address: total / SATOSHIS_PER_DGB for address, total in satoshis.items()}
 
 
 class EnigmaticEncoder:
@@ -168,7 +200,7 @@ class EnigmaticEncoder:
         payload_for_hint = dict(payload)
 
         message = EnigmaticMessage(
-            id=message_id or str(uuid4()),
+            id=message_id or uuid4().hex,
             timestamp=datetime.now(timezone.utc),
             channel=channel,
             intent=symbol.intent or "symbol",
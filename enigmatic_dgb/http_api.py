@@ -26,6 +26,7 @@ from .planner import (
     DUST_LIMIT,
     PlanningError,
     broadcast_pattern_plan,
+    match_utxo_references,
     plan_explicit_pattern,
     plan_independent_pattern,
 )
@@ -339,17 +340,13 @@ def _load_selected_utxos(
     if not raw_refs:
         return []
     references = _parse_utxo_refs(raw_refs)
-    available = rpc.listunspent(min_confirmations)
-    indexed = {
-        (entry["txid"], int(entry["vout"])): entry
-        for entry in available
-        if entry.get("spendable", True)
-    }
-    missing = [ref for ref in references if ref not in indexed]
+    selected, missing = match_utxo_references(
+        rpc.listunspent(min_confirmations), references
+    )
     if missing:
         missing_desc = ", ".join(f"{txid}:{vout}" for txid, vout in missing)
         raise ValueError("Requested UTXOs not found or not spendable: " + missing_desc)
-    return [indexed[ref] for ref in references]
+    return selected
 
 
 def _wait_for_tx_confirmations(
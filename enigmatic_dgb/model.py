@@ -10,6 +10,7 @@ from __future__ import annotations
 
 from dataclasses import asdict, dataclass, field, replace
 from datetime import datetime
+from functools import cached_property
 from typing import Any, List
 
 from .encryption import EncryptedPayload, decrypt_payload
@@ -31,6 +32,12 @@ class EnigmaticMessage:
     payload: dict[str, Any] = field(default_factory=dict)
     encrypted: bool = False
 
+    @cached_property
+    def timestamp_iso(self) -> str:
+        """ISO 8601 rendering of ``timestamp``, formatted once per message."""
+
+        return self.timestamp.isoformat()
+
 
 def message_with_encrypted_payload(
     base_message: EnigmaticMessage, encrypted_payload: EncryptedPayload
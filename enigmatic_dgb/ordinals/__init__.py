@@ -6,28 +6,33 @@ and subject to change. The Enigmatic Taproot dialect v1 described in
 ``docs/taproot-dialect-v1.md`` is exposed here for discoverability.
 """
 
-from enigmatic_dgb.ordinals.index_store import (
-    OrdinalIndexStore,
-    SQLiteOrdinalIndexStore,
-)
-from enigmatic_dgb.ordinals.indexer import (
-    OrdinalIndexer,
-    OrdinalLocation,
-    OrdinalScanConfig,
-)
-from enigmatic_dgb.ordinals.inscriptions import (
-    ENIG_TAPROOT_MAGIC,
-    ENIG_TAPROOT_PROTOCOL,
-    ENIG_TAPROOT_VERSION_V1,
-    InscriptionMetadata,
-    InscriptionPayload,
-    OrdinalInscriptionDecoder,
-    OrdinalInscriptionPlanner,
-    decode_enig_taproot_payload,
-    encode_enig_taproot_payload,
-)
-from enigmatic_dgb.ordinals.ownership import OrdinalOwnershipView
-from enigmatic_dgb.ordinals.taproot import TaprootScriptView, inspect_output_for_taproot
+from __future__ import annotations
+
+import importlib
+from typing import Any
+
+# Resolved on first access so that importing one ordinal module does not pull
+# in the RPC client through the indexer and index store.
+_LAZY_IMPORTS: dict[str, tuple[str, ...]] = {
+    "indexer": ("OrdinalIndexer", "OrdinalLocation", "OrdinalScanConfig"),
+    "index_store": ("OrdinalIndexStore", "SQLiteOrdinalIndexStore"),
+    "inscriptions": (
+        "OrdinalInscriptionDecoder",
+        "OrdinalInscriptionPlanner",
+        "InscriptionMetadata",
+        "InscriptionPayload",
+        "encode_enig_taproot_payload",
+        "decode_enig_taproot_payload",
+        "ENIG_TAPROOT_MAGIC",
+        "ENIG_TAPROOT_VERSION_V1",
+        "ENIG_TAPROOT_PROTOCOL",
+    ),
+    "ownership": ("OrdinalOwnershipView",),
+    "taproot": ("TaprootScriptView", "inspect_output_for_taproot"),
+}
+_LAZY_ATTRIBUTES = {
+    name: module for module, names in _LAZY_IMPORTS.items() for name in names
+}
 
 __all__ = [
     "OrdinalIndexer",
@@ -48,3 +53,16 @@ __all__ = [
     "TaprootScriptView",
     "inspect_output_for_taproot",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    module = _LAZY_ATTRIBUTES.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -9,7 +9,7 @@ formal ordinal numbering.
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from typing import Iterable, List, Optional, Set
+from typing import Callable, Iterable, Iterator, List, Optional, Set
 
 from enigmatic_dgb.rpc_client import DigiByteRPCClient
 
@@ -34,6 +34,7 @@ class OrdinalScanConfig:
     limit: Optional[int]
     include_op_return: bool = True
     include_taproot_like: bool = True
+    rpc_batch_size: int = 50
 
 
 class OrdinalIndexer:
@@ -70,13 +71,39 @@ class OrdinalIndexer:
         best_height = self.rpc_client.get_best_height()
         start_height = config.start_height if config.start_height is not None else 0
         end_height = config.end_height if config.end_height is not None else best_height
-        yielded = 0
+        heights = range(start_height, end_height + 1)
+        if config.limit is not None:
+            heights = heights[: max(config.limit, 0)]
+
+        yield from self._fetch_blocks(heights, config.rpc_batch_size)
+
+    def _fetch_blocks(
+        self,
+        heights: range,
+        batch_size: int,
+        remaining: Callable[[], int] | None = None,
+    ) -> Iterator[dict]:
+        """Yield blocks for ``heights`` in order, batching RPC calls if possible.
+
+        Clients exposing ``getblocks_by_height`` fetch up to ``batch_size``
+        blocks per pair of batched requests; others fall back to one block per
+        call. ``remaining`` reports how many more results the caller still
+        wants, and each batch is capped at that so a nearly reached limit does
+        not download a full batch of unused blocks.
+        """
 
-        for height in range(start_height, end_height + 1):
-            if config.limit is not None and yielded >= config.limit:
-                break
-            yield self.rpc_client.getblock_by_height(height)
-            yielded += 1
+        fetch_many = getattr(self.rpc_client, "getblocks_by_height", None)
+        if fetch_many is None or batch_size <= 1:
+            for height in heights:
+                yield self.rpc_client.getblock_by_height(height)
+            return
+        offset = 0
+        while offset < len(heights):
+            size = batch_size
+            if remaining is not None:
+                size = max(1, min(size, remaining()))
+            yield from fetch_many(heights[offset : offset + size])
+            offset += size
 
     def _scan_block(
         self, block_json: dict, config: OrdinalScanConfig
@@ -94,6 +121,9 @@ class OrdinalIndexer:
 
         candidate_locations: List[OrdinalLocation] = []
         block_height = block_json.get("height")
+        if config.include_taproot_like:
+            from enigmatic_dgb.ordinals import taproot
+            from enigmatic_dgb.ordinals.inscriptions import ENIG_TAPROOT_MAGIC
 
         for tx in block_json.get("tx", []):
             txid = tx.get("txid") or tx.get("hash")
@@ -133,11 +163,10 @@ class OrdinalIndexer:
                         return candidate_locations
 
                 if config.include_taproot_like:
-                    from enigmatic_dgb.ordinals import taproot
-                    from enigmatic_dgb.ordinals.inscriptions import ENIG_TAPROOT_MAGIC
-
+                    # Verbosity 2 blocks (and scan_tx) already carry the decoded
+                    # transaction, so no per-output getrawtransaction is needed.
                     taproot_view = taproot.inspect_output_for_taproot(
-                        self.rpc_client, txid, vout_index
+                        self.rpc_client, txid, vout_index, verbose_tx=tx
                     )
                     if taproot_view.is_taproot_like:
                         taproot_tags = {"taproot_like", "inscription_candidate"}
@@ -205,12 +234,14 @@ class OrdinalIndexer:
         end_height = config.end_height if config.end_height is not None else best_height
 
         locations: List[OrdinalLocation] = []
+        heights = range(start_height, end_height + 1)
 
-        for height in range(start_height, end_height + 1):
+        limit = config.limit
+        remaining = (lambda: limit - len(locations)) if limit is not None else None
+        for block_json in self._fetch_blocks(heights, config.rpc_batch_size, remaining):
             if config.limit is not None and len(locations) >= config.limit:
                 break
 
-            block_json = self.rpc_client.getblock_by_height(height)
             block_locations = self._scan_block(block_json, config)
             locations.extend(block_locations)
 
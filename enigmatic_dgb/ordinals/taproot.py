@@ -54,7 +54,9 @@ class TaprootScriptView:
     notes: str | None
 
 
-def inspect_output_for_taproot(rpc_client, txid: str, vout: int) -> TaprootScriptView:
+def inspect_output_for_taproot(
+    rpc_client, txid: str, vout: int, verbose_tx: Optional[Dict[str, Any]] = None
+) -> TaprootScriptView:
     """Best-effort inspection of a transaction output for Taproot patterns.
 
     This helper intentionally stops short of full BIP341/BIP342 validation. It
@@ -62,9 +64,14 @@ def inspect_output_for_taproot(rpc_client, txid: str, vout: int) -> TaprootScrip
     1 witness programs and by collecting raw witness data from every input.
     The goal is to expose enough low-level material (witness stack, control
     blocks, possible leaf scripts) for downstream inscription detection.
+
+    Callers that already hold the decoded transaction (for example from a
+    ``getblock`` verbosity 2 payload) pass it as ``verbose_tx`` to skip the
+    ``getrawtransaction`` call, which also requires ``-txindex`` on the node.
     """
 
-    verbose_tx: Dict[str, Any] = rpc_client.getrawtransaction(txid, verbose=True)
+    if verbose_tx is None:
+        verbose_tx = rpc_client.getrawtransaction(txid, verbose=True)
     outputs = verbose_tx.get("vout", [])
     target_output = next((o for o in outputs if o.get("n") == vout), None)
     script_pubkey = target_output.get("scriptPubKey", {}) if target_output else {}
@@ -7,7 +7,7 @@ from dataclasses import dataclass
 from decimal import Decimal, ROUND_DOWN, getcontext
 import time
 from pathlib import Path
-from typing import Any, Callable, Dict, List, Mapping, Sequence
+from typing import Any, Callable, Dict, Iterable, List, Mapping, Sequence
 
 import yaml
 
@@ -677,6 +677,39 @@ class SymbolPlanner:
         return self.rpc.getnewaddress()
 
 
+def match_utxo_references(
+    available: Iterable[dict[str, Any]],
+    references: Sequence[tuple[str, int]],
+) -> tuple[list[dict[str, Any]], list[tuple[str, int]]]:
+    """Return the spendable UTXOs for ``references`` and any refs not found.
+
+    Selected entries keep the order of ``references``. Only the requested
+    outpoints are indexed: most wallet entries are rejected by a txid set
+    lookup and never pay for a tuple key or ``int(vout)``.
+    """
+
+    wanted = set(references)
+    wanted_txids = {txid for txid, _ in wanted}
+    indexed: dict[tuple[str, int], dict[str, Any]] = {}
+    for entry in available:
+        if entry["txid"] not in wanted_txids or not entry.get("spendable", True):
+            continue
+        key = (entry["txid"], int(entry["vout"]))
+        if key in wanted:
+            indexed[key] = entry
+            if len(indexed) == len(wanted):
+                break
+    selected: list[dict[str, Any]] = []
+    missing: list[tuple[str, int]] = []
+    for ref in references:
+        found: dict[str, Any] | None = indexed.get(ref)
+        if found is None:
+            missing.append(ref)
+        else:
+            selected.append(found)
+    return selected, missing
+
+
 def plan_explicit_pattern(
     rpc: DigiByteRPC,
     *,
@@ -687,6 +720,7 @@ def plan_explicit_pattern(
     script_plane: ScriptPlane | None = None,
     preferred_utxos: Sequence[Mapping[str, Any]] | None = None,
     allow_unconfirmed_chain: bool = False,
+    available_utxos: Sequence[Mapping[str, Any]] | None = None,
 ) -> PatternPlanSequence:
     if not amounts:
         raise PlanningError("At least one output amount must be provided")
@@ -703,11 +737,13 @@ def plan_explicit_pattern(
     if fee < 0:
         raise PlanningError("Fee must be non-negative")
     required_total = total_pattern + (fee * len(normalized_amounts))
-    utxos = (
-        list(preferred_utxos)
-        if preferred_utxos is not None
-        else rpc.listunspent(min_confirmations)
-    )
+    utxos: Sequence[Mapping[str, Any]]
+    if preferred_utxos is not None:
+        utxos = list(preferred_utxos)
+    elif available_utxos is not None:
+        utxos = list(available_utxos)
+    else:
+        utxos = rpc.listunspent(min_confirmations)
     if preferred_utxos is not None and min_confirmations > 0:
         for entry in utxos:
             confirmations = int(entry.get("confirmations", 0) or 0)
@@ -820,8 +856,13 @@ def plan_independent_pattern(
     script_plane: ScriptPlane | None = None,
     preferred_utxos: Sequence[Mapping[str, Any]] | None = None,
     allow_unconfirmed_chain: bool = False,
+    available_utxos: Sequence[Mapping[str, Any]] | None = None,
 ) -> PatternPlanSequence:
-    """Plan a non-chained pattern where each step uses independent inputs."""
+    """Plan a non-chained pattern where each step uses independent inputs.
+
+    ``available_utxos`` may carry a ``listunspent`` result the caller already
+    fetched at ``min_confirmations``; otherwise the wallet is queried.
+    """
 
     if not amounts:
         raise PlanningError("At least one output amount must be provided")
@@ -833,11 +874,13 @@ def plan_independent_pattern(
     if fee < 0:
         raise PlanningError("Fee must be non-negative")
 
-    utxos = (
-        list(preferred_utxos)
-        if preferred_utxos is not None
-        else rpc.listunspent(min_confirmations)
-    )
+    utxos: Sequence[Mapping[str, Any]]
+    if preferred_utxos is not None:
+        utxos = list(preferred_utxos)
+    elif available_utxos is not None:
+        utxos = list(available_utxos)
+    else:
+        utxos = rpc.listunspent(min_confirmations)
     if preferred_utxos is not None and min_confirmations > 0:
         for entry in utxos:
             confirmations = int(entry.get("confirmations", 0) or 0)
@@ -870,10 +913,10 @@ def plan_independent_pattern(
                     "Fund the wallet or allow unconfirmed funding."
                 )
 
-    available_utxos = list(utxos)
+    remaining_utxos = list(utxos)
     steps: list[PatternPlan] = []
     for index, amount in enumerate(normalized_amounts, start=1):
-        if not available_utxos:
+        if not remaining_utxos:
             raise PlanningError(
                 "Independent sequences require enough distinct UTXOs to fund each step. "
                 "Run prepare-utxos or enable --chained."
@@ -881,7 +924,7 @@ def plan_independent_pattern(
         required_total = amount + fee
         try:
             selected, total = _select_utxos_covering_total(
-                available_utxos, required_total
+                remaining_utxos, required_total
             )
         except PlanningError as exc:
             raise PlanningError(
@@ -889,7 +932,7 @@ def plan_independent_pattern(
                 "run prepare-utxos, add funding, or enable --chained."
             ) from exc
         for entry in selected:
-            available_utxos.remove(entry)
+            remaining_utxos.remove(entry)
         step_inputs = [
             PatternInput(
                 txid=str(entry["txid"]),
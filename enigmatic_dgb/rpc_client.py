@@ -14,13 +14,13 @@ forwards well-typed requests and surfaces errors clearly.
 import json
 import logging
 import uuid
-from typing import Any, Dict, Optional
-
-import requests
-from requests import RequestException, Response
+from typing import TYPE_CHECKING, Any, Dict, Optional, Sequence, Tuple
 
 from .config import ConfigurationError, RPCConfig, load_rpc_config
 
+if TYPE_CHECKING:
+    from requests import Response
+
 logger = logging.getLogger(__name__)
 
 
@@ -113,6 +113,10 @@ class DigiByteRPCClient:
     """
 
     def __init__(self, config: RPCConfig) -> None:
+        # Imported here so that modules which only reference the client (and
+        # CLI commands that never talk to a node) skip loading the HTTP stack.
+        import requests
+
         self.config = config
         self._session = requests.Session()
         self._base_url = config.base_url
@@ -134,6 +138,52 @@ class DigiByteRPCClient:
             "params": params or [],
         }
         logger.debug("RPC call %s params=%s", method, params)
+        response, result = self._post(payload)
+        if result.get("error"):
+            error = result["error"]
+            raise RPCError(error.get("code", -1), error.get("message", "unknown"))
+        if not response.ok:
+            self._raise_http_error(response)
+        return result.get("result")
+
+    def batch(self, calls: Sequence[Tuple[str, list[Any]]]) -> list[Any]:
+        """Perform several JSON-RPC requests in one HTTP round trip.
+
+        Results are returned in the order of ``calls``. The first failed call
+        (in that order) raises :class:`RPCError`.
+        """
+
+        if not calls:
+            return []
+        payload = [
+            {"jsonrpc": "2.0", "id": index, "method": method, "params": params}
+            for index, (method, params) in enumerate(calls)
+        ]
+        logger.debug("RPC batch of %d calls", len(payload))
+        response, results = self._post(payload)
+        if isinstance(results, dict):
+            # Nodes answer a rejected batch with a single error object.
+            error = results.get("error") or {}
+            raise RPCError(error.get("code", -1), error.get("message", "unknown"))
+        by_id = {entry.get("id"): entry for entry in results}
+        ordered: list[Any] = []
+        for index in range(len(payload)):
+            entry = by_id.get(index)
+            if entry is None:
+                raise RPCTransportError("RPC batch response is missing results")
+            if entry.get("error"):
+                error = entry["error"]
+                raise RPCError(error.get("code", -1), error.get("message", "unknown"))
+            ordered.append(entry.get("result"))
+        if not response.ok:
+            self._raise_http_error(response)
+        return ordered
+
+    def _post(self, payload: Any) -> Tuple[Response, Any]:
+        """POST ``payload`` and return the response with its decoded JSON body."""
+
+        import requests
+
         try:
             response = self._session.post(
                 self._url,
@@ -142,7 +192,7 @@ class DigiByteRPCClient:
                 auth=(self.config.user, self.config.password),
                 timeout=30,
             )
-        except RequestException as exc:
+        except requests.RequestException as exc:
             logger.error(
                 "RPC connection failed: %s",
                 exc,
@@ -153,39 +203,29 @@ class DigiByteRPCClient:
                 "and DGB_RPC_* variables (or ~/.enigmatic.yaml) point to the right host and port."
             ) from exc
         try:
-            result = response.json()
+            return response, response.json()
         except ValueError as exc:
             logger.debug("RPC JSON parse error: %s", response.text, exc_info=True)
-            try:
-                self._raise_for_status(response)
-            except requests.HTTPError as status_exc:
-                logger.error(
-                    "RPC HTTP error: %s",
-                    status_exc,
-                    exc_info=logger.isEnabledFor(logging.DEBUG),
-                )
-                raise RPCTransportError(
-                    "RPC server returned an HTTP error; check the URL, wallet path, authentication, and DGB_RPC_* settings.",
-                    status_code=response.status_code,
-                ) from status_exc
+            self._raise_http_error(response)
             raise RPCTransportError("RPC server returned malformed JSON") from exc
-        if result.get("error"):
-            error = result["error"]
-            raise RPCError(error.get("code", -1), error.get("message", "unknown"))
-        if not response.ok:
-            try:
-                self._raise_for_status(response)
-            except requests.HTTPError as exc:
-                logger.error(
-                    "RPC HTTP error: %s",
-                    exc,
-                    exc_info=logger.isEnabledFor(logging.DEBUG),
-                )
-                raise RPCTransportError(
-                    "RPC server returned an HTTP error; check the URL, wallet path, authentication, and DGB_RPC_* settings.",
-                    status_code=response.status_code,
-                ) from exc
-        return result.get("result")
+
+    def _raise_http_error(self, response: Response) -> None:
+        """Raise :class:`RPCTransportError` if ``response`` has an HTTP error."""
+
+        import requests
+
+        try:
+            self._raise_for_status(response)
+        except requests.HTTPError as exc:
+            logger.error(
+                "RPC HTTP error: %s",
+                exc,
+                exc_info=logger.isEnabledFor(logging.DEBUG),
+            )
+            raise RPCTransportError(
+                "RPC server returned an HTTP error; check the URL, wallet path, authentication, and DGB_RPC_* settings.",
+                status_code=response.status_code,
+            ) from exc
 
     def _raise_for_status(self, response: Response) -> None:
         # DigiByte Core surfaces JSON-RPC errors as HTTP 500; logging the
@@ -205,6 +245,8 @@ class DigiByteRPCClient:
                     "Unauthorized (401). Ensure ENIGMATIC_DGB_RPC_USER/DGB_RPC_USER (or your .enigmatic.yaml) contains valid credentials.",
                     status_code=response.status_code,
                 )
+        import requests
+
         try:
             response.raise_for_status()
         except requests.HTTPError as exc:
@@ -253,6 +295,14 @@ class DigiByteRPCClient:
         block_hash = self.getblockhash(height)
         return self.getblock(block_hash, verbosity=2)
 
+    def getblocks_by_height(self, heights: Sequence[int]) -> list[Dict[str, Any]]:
+        """Retrieve several verbosity=2 blocks using two batched requests."""
+
+        block_hashes = self.batch([("getblockhash", [height]) for height in heights])
+        return self.batch(
+            [("getblock", [block_hash, 2]) for block_hash in block_hashes]
+        )
+
     def get_best_height(self) -> int:
         """Return the current best chain height."""
 
@@ -263,10 +313,20 @@ class DigiByteRPCClient:
         minconf: int = 1,
         maxconf: int = 9999999,
         addresses: Optional[list[str]] = None,
+        query_options: Optional[Dict[str, Any]] = None,
     ) -> list[Dict[str, Any]]:
+        """List wallet UTXOs, letting the node filter by address and options.
+
+        ``query_options`` is passed through as ``listunspent``'s options object
+        (``minimumAmount``, ``maximumCount``, ...) so large wallets return only
+        the entries a caller needs.
+        """
+
         params: list[Any] = [minconf, maxconf]
-        if addresses is not None:
-            params.append(addresses)
+        if addresses is not None or query_options is not None:
+            params.append(addresses or [])
+        if query_options is not None:
+            params.extend([True, query_options])  # include_unsafe keeps its default
         return self.call("listunspent", params)
 
     def getnewaddress(
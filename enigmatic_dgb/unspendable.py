@@ -9,7 +9,6 @@ unspendable* and must never be used to store actual funds.
 
 from __future__ import annotations
 
-import binascii
 import hashlib
 from typing import List, Tuple
 
@@ -93,7 +92,7 @@ def base58_check_encode(payload: bytes, version: bytes) -> str:
     checksum = _double_sha256(data)[:4]
     address_bytes = data + checksum
 
-    value = int("0x0" + binascii.hexlify(address_bytes).decode("utf8"), 16)
+    value = int.from_bytes(address_bytes, "big")
 
     output: List[str] = []
     while value > 0:
@@ -127,7 +126,7 @@ def base58_decode(value: str, version: bytes) -> bytes:
     hex_value = f"{number:x}"
     if len(hex_value) % 2:
         hex_value = "0" + hex_value
-    decoded = binascii.unhexlify(hex_value.encode("utf8"))
+    decoded = bytes.fromhex(hex_value)
 
     padding = 0
     for character in value[:-1]:
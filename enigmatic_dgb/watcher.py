@@ -64,8 +64,16 @@ class Watcher:
                 messages.append(message)
         return messages
 
-    def run_forever(self, callback: Callable[[EnigmaticMessage], None]) -> None:
-        """Continuously poll and emit decoded messages via callback."""
+    def run_forever(
+        self,
+        callback: Callable[[EnigmaticMessage], None],
+        after_poll: Callable[[], None] | None = None,
+    ) -> None:
+        """Continuously poll and emit decoded messages via callback.
+
+        ``after_poll`` runs once per polling cycle after every message has been
+        passed to ``callback``, letting callers batch output per cycle.
+        """
 
         logger.info("Starting watcher for %d addresses", len(self.addresses))
         while True:
@@ -74,6 +82,8 @@ class Watcher:
                     callback(message)
             except Exception:  # pragma: no cover - best effort logging
                 logger.exception("Watcher loop encountered an error")
+            if after_poll is not None:
+                after_poll()
             time.sleep(self.poll_interval_seconds)
 
     def _filter_new_transactions(
@@ -1,3 +1,5 @@
+import io
+import json
 from decimal import Decimal
 
 import pytest
@@ -43,6 +45,17 @@ class RecordingBuilder:
         return f"txid-{len(self.calls)}"
 
 
+@pytest.fixture(params=["orjson", "stdlib"])
+def json_backend(request, monkeypatch) -> str:
+    """Run a test once with orjson (when installed) and once without it."""
+
+    if request.param == "orjson" and cli.orjson is None:
+        pytest.skip("orjson is not installed")
+    if request.param == "stdlib":
+        monkeypatch.setattr(cli, "orjson", None)
+    return request.param
+
+
 @pytest.mark.parametrize(
     "ascii_values, expected",
     [
@@ -75,3 +88,281 @@ def test_execute_sequence_plan_attaches_op_return_and_change():
     second_call = builder.calls[1]
     assert second_call["op_return"] == ["bb"]
     assert second_call["inputs"][0]["txid"] == "funding-b"
+
+
+def test_build_parser_populates_only_the_requested_command() -> None:
+    argv = [
+        "--config",
+        "custom.yaml",
+        "plan-sequence",
+        "--to-address",
+        "dgb1x",
+        "--amounts",
+        "1",
+    ]
+    assert cli._requested_command(argv) == "plan-sequence"
+    parser = cli.build_parser("plan-sequence")
+    assert parser is cli.build_parser("plan-sequence")
+    args = parser.parse_args(argv)
+    assert args.command == "plan-sequence"
+    assert args.config == "custom.yaml"
+    with pytest.raises(SystemExit):
+        parser.parse_args(["dtsp-table"])
+
+
+def test_requested_command_scans_argv_without_parsing() -> None:
+    assert cli._requested_command(["--config=x.yaml", "watch"]) == "watch"
+    assert cli._requested_command(["--verbose", "--conf", "dtsp-table", "watch"]) == (
+        "watch"
+    )
+    assert cli._requested_command(["--help"]) is None
+    assert cli._requested_command(["unknown-command"]) is None
+
+
+def test_overview_parser_renders_the_full_help(capsys: pytest.CaptureFixture) -> None:
+    overview = cli._build_overview_parser()
+    full = cli.build_parser()
+    assert overview.format_help() == full.format_help()
+    with pytest.raises(SystemExit):
+        cli.main(["unknown-command"])
+    assert "invalid choice: 'unknown-command'" in capsys.readouterr().err
+
+
+def test_parse_amounts_csv_reports_the_invalid_entry() -> None:
+    assert cli._parse_amounts_csv(" 73, 61 ,,0.5e1") == [
+        Decimal("73"),
+        Decimal("61"),
+        Decimal("5"),
+    ]
+    with pytest.raises(cli.CLIError, match="Amount #2 is not a valid decimal"):
+        cli._parse_amounts_csv("1,abc,3")
+
+
+def test_split_csv_strips_only_the_ends_of_each_token() -> None:
+    assert cli._split_csv(" 1.5,\t2 ,\n,dgb1 abc") == ["1.5", "2", "dgb1 abc"]
+    # Inner whitespace is never glued away into a different value.
+    with pytest.raises(cli.CLIError, match="Amount #1 is not a valid decimal"):
+        cli._parse_amounts_csv("1 2")
+
+
+def test_every_subcommand_has_a_dispatch_handler() -> None:
+    assert set(cli._COMMANDS) == set(cli._SUBPARSER_BUILDERS)
+    assert cli._COMMANDS["plan-sequence"] is cli.cmd_send_sequence
+
+
+def test_decode_session_key_accepts_unpadded_input() -> None:
+    assert cli._decode_session_key("a2V5") == b"key"
+    assert cli._decode_session_key("a2V5MQ") == b"key1"
+    with pytest.raises(cli.CLIError):
+        cli._decode_session_key("ké")
+    with pytest.raises(cli.CLIError):
+        cli._decode_session_key("a")
+
+
+def test_max_outputs_per_tx_flag_defaults_and_validates(caplog) -> None:
+    args = cli.build_parser("send-message").parse_args(
+        ["send-message", "--to-address", "dgb1x", "--intent", "presence"]
+    )
+    assert args.max_outputs_per_tx == cli.MAX_OUTPUTS_PER_TX
+    with pytest.raises(cli.CLIError):
+        cli._parse_max_outputs_per_tx(0)
+    with caplog.at_level("WARNING"):
+        assert cli._parse_max_outputs_per_tx(5000) == 5000
+    assert "relay" in caplog.text
+
+
+def test_watch_writes_each_poll_cycle_as_json_lines(
+    json_backend, monkeypatch, capsys
+) -> None:
+    from datetime import datetime, timezone
+    from types import SimpleNamespace
+
+    from enigmatic_dgb import watcher as watcher_module
+    from enigmatic_dgb.model import EnigmaticMessage
+
+    message = EnigmaticMessage(
+        id="m1",
+        timestamp=datetime(2024, 1, 2, tzinfo=timezone.utc),
+        channel="ops",
+        intent="presence",
+        payload={"note": "héllo"},
+    )
+
+    class FakeWatcher:
+        def __init__(self, *args, **kwargs) -> None:
+            pass
+
+        def run_forever(self, emit, after_poll) -> None:
+            emit(message)
+            emit(message)
+            after_poll()
+
+    monkeypatch.setattr(watcher_module, "Watcher", FakeWatcher)
+    monkeypatch.setattr(cli, "_rpc_client", lambda: object())
+    args = SimpleNamespace(address="dgb1x", poll_interval=1, dry_run=False)
+
+    cli.cmd_watch(args)
+    lines = capsys.readouterr().out.splitlines()
+    assert len(lines) == 2
+    assert json.loads(lines[0]) == {
+        "id": "m1",
+        "timestamp": "2024-01-02T00:00:00+00:00",
+        "channel": "ops",
+        "intent": "presence",
+        "payload": {"note": "héllo"},
+        "encrypted": False,
+    }
+
+    text_only = io.StringIO()
+    monkeypatch.setattr(cli.sys, "stdout", text_only)
+    cli.cmd_watch(args)
+    assert text_only.getvalue().splitlines() == lines
+
+
+def test_parser_defaults_track_their_source_constants() -> None:
+    from enigmatic_dgb.dtsp import DTSP_TOLERANCE
+    from enigmatic_dgb.planner import DUST_LIMIT
+
+    assert cli._DTSP_TOLERANCE_DEFAULT == DTSP_TOLERANCE
+    assert cli._POSTAGE_DGB_DEFAULT == str(DUST_LIMIT)
+    args = cli.build_parser("ord-inscribe").parse_args(["ord-inscribe", "hi"])
+    assert args.postage_dgb == DUST_LIMIT
+
+
+def test_lazy_module_attributes_resolve_on_access() -> None:
+    from enigmatic_dgb import planner
+
+    assert cli.plan_explicit_pattern is planner.plan_explicit_pattern
+    assert "plan_explicit_pattern" in vars(cli)
+    with pytest.raises(AttributeError):
+        cli.not_a_cli_attribute
+
+
+def test_parse_payload_json_handles_defaults_and_large_values() -> None:
+    assert cli._parse_payload_json("{}") == {}
+    assert cli._parse_payload_json("{}") is not cli._parse_payload_json("{}")
+    assert cli._parse_payload_json('{"n": 18446744073709551616}') == {"n": 2**64}
+    with pytest.raises(cli.CLIError):
+        cli._parse_payload_json("{not json")
+    with pytest.raises(cli.CLIError):
+        cli._parse_payload_json("[1]")
+
+
+def test_parse_utxo_refs_requires_hex_txid_and_vout() -> None:
+    txid = "ab" * 32
+    assert cli._parse_utxo_refs(f"{txid}:0, {txid.upper()}:12") == [
+        (txid, 0),
+        (txid.upper(), 12),
+    ]
+    for bad in ("abc:0", f"{txid}", f"{txid}:x", f"{txid}:-1", " , "):
+        with pytest.raises(cli.CLIError):
+            cli._parse_utxo_refs(bad)
+
+
+def test_json_helpers_match_stdlib_layout(json_backend) -> None:
+    data = [{"txid": "ab", "vout": 0, "tags": [], "meta": {}, "height": None}]
+    assert cli._dumps_pretty(data) == json.dumps(data, indent=2)
+    assert cli._dumps_compact(data) == json.dumps(data, separators=(",", ":"))
+    # Non-string keys fall back to the stdlib encoder instead of failing.
+    assert cli._dumps_compact({1: "a"}) == '{"1":"a"}'
+    assert cli._dumps_pretty({1: "a"}) == '{\n  "1": "a"\n}'
+    assert cli._dumps_compact_bytes({1: "a"}) == b'{"1":"a"}'
+
+
+def test_print_json_array_streams_the_pretty_layout(json_backend, capsys) -> None:
+    items = [{"a": [1, {"b": "x\ny"}], "c": {}}, [], "s"]
+    cli._print_json_array(iter(items))
+    assert capsys.readouterr().out == cli._dumps_pretty(items) + "\n"
+    cli._print_json_array([])
+    assert capsys.readouterr().out == "[]\n"
+
+
+def test_decimal_flags_are_converted_by_argparse(capsys) -> None:
+    parser = cli.build_parser("plan-sequence")
+    base = ["plan-sequence", "--to-address", "dgb1x", "--amounts", "1"]
+    args = parser.parse_args(base)
+    assert args.fee == Decimal("0.21")
+    assert args.auto_prepare_fee is None
+    args = parser.parse_args(base + ["--fee", "0.5", "--auto-prepare-fee", "0"])
+    assert (args.fee, args.auto_prepare_fee) == (Decimal("0.5"), Decimal("0"))
+    with pytest.raises(SystemExit):
+        parser.parse_args(base + ["--fee", "abc"])
+    assert "invalid decimal value: 'abc'" in capsys.readouterr().err
+
+
+def test_plan_sequence_queries_listunspent_once(
+    json_backend, monkeypatch, capsys
+) -> None:
+    class CountingRPC(SequenceRPC):
+        def __init__(self) -> None:
+            super().__init__()
+            self.listunspent_calls: list[int] = []
+
+        def listunspent(self, minconf: int) -> list[dict[str, object]]:
+            self.listunspent_calls.append(minconf)
+            return super().listunspent(minconf)
+
+    rpc = CountingRPC()
+    monkeypatch.setattr(cli, "_rpc_client", lambda *args, **kwargs: rpc)
+    args = cli.build_parser("plan-sequence").parse_args(
+        ["plan-sequence", "--to-address", "DTdest", "--amounts", "10,5"]
+    )
+    cli.cmd_send_sequence(args)
+
+    assert rpc.listunspent_calls == [args.min_confirmations]
+    assert "funding-b" in capsys.readouterr().out
+
+
+def test_load_selected_utxos_matches_requested_outpoints() -> None:
+    txid_a, txid_b = "a" * 64, "b" * 64
+    available = [
+        {"txid": txid_a, "vout": 0, "amount": 1},
+        {"txid": txid_a, "vout": "1", "amount": 2},
+        {"txid": txid_b, "vout": 0, "amount": 3, "spendable": False},
+    ]
+    listunspent = lambda minconf: available  # noqa: E731
+
+    selected = cli._load_selected_utxos(
+        None, f"{txid_a}:1,{txid_a}:0", 1, listunspent=listunspent
+    )
+    assert [entry["amount"] for entry in selected] == [2, 1]
+    with pytest.raises(cli.CLIError, match=f"{txid_b}:0"):
+        cli._load_selected_utxos(None, f"{txid_b}:0", 1, listunspent=listunspent)
+
+
+def test_list_utxos_lets_the_node_filter(monkeypatch, capsys) -> None:
+    class ListRPC:
+        def __init__(self) -> None:
+            self.kwargs: dict[str, object] = {}
+
+        def listunspent(self, minconf: int, **kwargs: object) -> list[dict]:
+            self.kwargs = kwargs
+            return [{"txid": "t", "vout": 0, "amount": 2, "address": "dgb1b"}]
+
+    rpc = ListRPC()
+    monkeypatch.setattr(cli, "_rpc_client", lambda *args, **kwargs: rpc)
+    args = cli.build_parser("list-utxos").parse_args(
+        ["list-utxos", "--address", "dgb1b, dgb1a", "--min-amount", "1.5"]
+    )
+    cli.cmd_list_utxos(args)
+
+    assert rpc.kwargs == {
+        "addresses": ["dgb1a", "dgb1b"],
+        "query_options": {"minimumAmount": 1.5},
+    }
+    assert "Found 1 UTXOs" in capsys.readouterr().out
+
+
+def test_list_utxos_names_an_address_the_node_rejects(monkeypatch) -> None:
+    from enigmatic_dgb.rpc_client import RPCError
+
+    class RejectingRPC:
+        def listunspent(self, minconf: int, **kwargs: object) -> list[dict]:
+            raise RPCError(-5, "Invalid DigiByte address: dgb1typo")
+
+    monkeypatch.setattr(cli, "_rpc_client", lambda *args, **kwargs: RejectingRPC())
+    args = cli.build_parser("list-utxos").parse_args(
+        ["list-utxos", "--address", "dgb1good,dgb1typo"]
+    )
+    with pytest.raises(cli.CLIError, match="Invalid --address dgb1typo: "):
+        cli.cmd_list_utxos(args)
@@ -126,3 +126,28 @@ def test_send_symbol_uses_transaction_builder(monkeypatch: pytest.MonkeyPatch) -
     assert captured["outputs"]["DTdest"] == pytest.approx(300.1)
     assert captured["fee"] == pytest.approx(0.5)
     assert captured["op_return_data"]
+
+
+def test_load_dialect_reuses_parse_until_file_changes(tmp_path: Path) -> None:
+    template = """
+name: {name}
+description: cached
+fee_punctuation: 0.21
+symbols:
+  PING:
+    description: ping
+    anchors: [217]
+    micros: [0.076]
+    metadata:
+      tags: [a]
+    """.strip()
+    path = _write(tmp_path, template.format(name="first"))
+
+    first = load_dialect(path)
+    first.symbols["PING"].metadata["tags"].append("mutated")
+    again = load_dialect(path)
+    assert again is not first
+    assert again.symbols["PING"].metadata == {"tags": ["a"]}
+
+    path.write_text(template.format(name="second-version"))
+    assert load_dialect(path).name == "second-version"
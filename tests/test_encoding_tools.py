@@ -1,3 +1,5 @@
+import copy
+import io
 from decimal import Decimal
 
 import pytest
@@ -6,9 +8,13 @@ from enigmatic_dgb.binary_packets import (
     BinaryEncodingError,
     decode_binary_packets_to_text,
     encode_text_to_binary_packets,
+    encode_text_to_satoshis,
+    format_packets_human_readable,
 )
 from enigmatic_dgb.dtsp import (
+    DTSP_ALPHABET,
     DTSPEncodingError,
+    closest_dtsp_symbol,
     decode_dtsp_sequence_to_message,
     encode_handshake_accept,
     encode_handshake_end,
@@ -41,6 +47,19 @@ def test_dtsp_rejects_unknown_characters():
         encode_message_to_dtsp_sequence("€")
 
 
+def test_closest_dtsp_symbol_matches_a_linear_scan():
+    def linear(value):
+        return min(DTSP_ALPHABET, key=lambda symbol: abs(value - DTSP_ALPHABET[symbol]))
+
+    targets = list(DTSP_ALPHABET.values())
+    probes = targets + [(a + b) / 2 for a in targets for b in targets] + [0.0, 1.0]
+    for value in probes:
+        symbol, error = closest_dtsp_symbol(value, tolerance=1.0)
+        assert symbol == linear(value)
+        assert error == abs(value - DTSP_ALPHABET[symbol])
+    assert closest_dtsp_symbol(float("nan")) == (None, float("inf"))
+
+
 def test_binary_packet_roundtrip():
     packets = encode_text_to_binary_packets(
         "Hi", base_amount=Decimal("0"), bits_per_char=8
@@ -55,6 +74,72 @@ def test_binary_packet_roundtrip():
     assert decoded == "Hi"
 
 
+def test_binary_packet_decoder_accepts_a_generator():
+    packets = encode_text_to_binary_packets("Hi")
+    decoded = decode_binary_packets_to_text(packet.amount for packet in packets)
+    assert decoded == "Hi"
+
+
 def test_binary_packet_rejects_invalid_digit_sequences():
     with pytest.raises(BinaryEncodingError):
         decode_binary_packets_to_text([Decimal("0.12340000")], base_amount=Decimal("0"))
+
+
+def test_binary_packet_amounts_include_base_amount():
+    packets = encode_text_to_binary_packets("A", base_amount=Decimal("0.0001"))
+    assert packets[0].amount == Decimal("0.01010001")
+    assert str(packets[0].amount) == "0.01010001"
+
+
+def test_binary_packet_rejects_letters_outside_bit_width():
+    with pytest.raises(BinaryEncodingError, match="'é' cannot be represented"):
+        encode_text_to_binary_packets("abé", bits_per_char=7)
+
+
+def test_binary_packets_are_immutable_and_copyable():
+    packet = encode_text_to_binary_packets("A")[0]
+    with pytest.raises(AttributeError):
+        packet.letter = "B"
+    assert copy.deepcopy(packet) == packet
+
+
+def test_format_packets_human_readable_streams_to_output():
+    packets = encode_text_to_binary_packets("Hi")
+    rendered = format_packets_human_readable(packets)
+    assert rendered == (
+        "letter | bits | amount\n"
+        "H | 01001000 | 0.01011000\n"
+        "i | 01101001 | 0.01111001"
+    )
+    out = io.StringIO()
+    assert format_packets_human_readable(packets, out=out) is None
+    assert out.getvalue() == rendered + "\n"
+
+
+def test_encode_text_to_satoshis_matches_packet_amounts():
+    for bits in (7, 8):
+        packets = encode_text_to_binary_packets("Hi!", bits_per_char=bits)
+        satoshis = encode_text_to_satoshis("Hi!", bits_per_char=bits)
+        assert satoshis == [int(p.amount.scaleb(8)) for p in packets]
+    with pytest.raises(BinaryEncodingError, match="finer than one satoshi"):
+        encode_text_to_satoshis("Hi", bits_per_char=10)
+
+
+def test_repeated_letters_share_one_packet_instance():
+    packets = encode_text_to_binary_packets("abab")
+    assert packets[0] is packets[2]
+    assert packets[1] is packets[3]
+    assert packets[0] != packets[1]
+
+
+def test_package_exports_resolve_lazily():
+    import enigmatic_dgb
+    from enigmatic_dgb import ordinals
+
+    for package in (enigmatic_dgb, ordinals):
+        for name in package.__all__:
+            assert getattr(package, name) is not None
+        assert set(package.__all__) <= set(dir(package))
+        with pytest.raises(AttributeError):
+            getattr(package, "no_such_export")
+    assert enigmatic_dgb.closest_dtsp_symbol is closest_dtsp_symbol
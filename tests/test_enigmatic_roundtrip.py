@@ -6,7 +6,12 @@ import json
 from datetime import datetime, timedelta, timezone
 
 from enigmatic_dgb.decoder import EnigmaticDecoder, ObservedTx, group_into_packets
-from enigmatic_dgb.encoder import EnigmaticEncoder
+from enigmatic_dgb.encoder import (
+    EnigmaticEncoder,
+    SpendInstruction,
+    aggregate_spend_instructions,
+    iter_spend_batches,
+)
 from enigmatic_dgb.model import EncodingConfig, EnigmaticMessage
 from enigmatic_dgb.script_plane import ScriptPlane
 
@@ -161,3 +166,39 @@ def test_decoder_emits_script_plane_metadata() -> None:
     payload_plane = message.payload["script_plane"]
     assert payload_plane["branch_id"] == 11
     assert payload_plane["aggregation"]["aggregation_mode"] == "none"
+
+
+def test_aggregate_spend_instructions_sums_without_float_drift() -> None:
+    instructions = [
+        SpendInstruction("dgb1a", 0.1, False, True, "micro"),
+        SpendInstruction("dgb1a", 0.2, False, True, "micro"),
+        SpendInstruction("dgb1b", 217.0, True, False, "anchor"),
+        SpendInstruction(None, 0.0, False, False, "op_return", b"hi"),
+    ]
+    outputs, op_returns = aggregate_spend_instructions(instructions)
+    assert outputs == {"dgb1a": 0.3, "dgb1b": 217.0}
+    assert op_returns == [b"hi"]
+
+
+def test_iter_spend_batches_aggregates_each_batch() -> None:
+    instructions = iter(
+        [
+            SpendInstruction("dgb1a", 0.1, False, True, "micro"),
+            SpendInstruction("dgb1a", 0.2, False, True, "micro"),
+            SpendInstruction(None, 0.0, False, False, "op_return", b"hi"),
+            SpendInstruction("dgb1b", 1.5, True, False, "anchor"),
+        ]
+    )
+    batches = list(iter_spend_batches(instructions, 3))
+    assert batches == [({"dgb1a": 0.3}, [b"hi"]), ({"dgb1b": 1.5}, [])]
+    assert list(iter_spend_batches([], 3)) == []
+    assert aggregate_spend_instructions([]) == ({}, [])
+
+
+def test_message_timestamp_iso_is_cached() -> None:
+    timestamp = datetime(2024, 1, 2, 3, 4, 5, tzinfo=timezone.utc)
+    message = EnigmaticMessage(
+        id="m", timestamp=timestamp, channel="c", intent="presence"
+    )
+    assert message.timestamp_iso == "2024-01-02T03:04:05+00:00"
+    assert message.timestamp_iso is message.timestamp_iso
@@ -1,7 +1,11 @@
 from __future__ import annotations
 
+import json
 from dataclasses import dataclass
 
+import pytest
+
+from enigmatic_dgb.config import RPCConfig
 from enigmatic_dgb.ordinals.indexer import (
     OrdinalIndexer,
     OrdinalLocation,
@@ -11,6 +15,7 @@ from enigmatic_dgb.ordinals.inscriptions import (
     InscriptionPayload,
     OrdinalInscriptionDecoder,
 )
+from enigmatic_dgb.rpc_client import DigiByteRPCClient, RPCError
 
 
 @dataclass
@@ -82,3 +87,111 @@ def test_decode_from_tx_extracts_op_return_payload() -> None:
     assert "hello-enigmatic" in payload.decoded_text
     assert payload.metadata.location.txid == txid
     assert "op_return" in payload.metadata.location.tags
+
+
+def test_scan_range_batches_block_fetches_when_supported() -> None:
+    rpc, txid, _ = _build_mock_data()
+    requested: list[list[int]] = []
+
+    class BatchingRPC:
+        def get_best_height(self) -> int:
+            return 46
+
+        def getblocks_by_height(self, heights) -> list[dict]:
+            requested.append(list(heights))
+            return [rpc.block if h == 42 else {"height": h, "tx": []} for h in heights]
+
+        # No getrawtransaction: Taproot inspection reuses the block's tx JSON.
+
+    config = OrdinalScanConfig(
+        start_height=40, end_height=46, limit=None, rpc_batch_size=3
+    )
+    locations = OrdinalIndexer(BatchingRPC()).scan_range(config)
+
+    assert requested == [[40, 41, 42], [43, 44, 45], [46]]
+    assert [location.txid for location in locations] == [txid]
+
+
+def test_scan_range_caps_batches_at_the_remaining_limit() -> None:
+    requested: list[list[int]] = []
+
+    def block(height: int) -> dict:
+        data_hex = "656e6967"  # every block carries one OP_RETURN candidate
+        vout = {
+            "n": 0,
+            "value": 0,
+            "scriptPubKey": {"type": "nulldata", "asm": f"OP_RETURN {data_hex}"},
+        }
+        return {"height": height, "tx": [{"txid": f"tx{height}", "vout": [vout]}]}
+
+    class BatchingRPC:
+        def get_best_height(self) -> int:
+            return 100
+
+        def getblocks_by_height(self, heights) -> list[dict]:
+            requested.append(list(heights))
+            return [block(h) for h in heights]
+
+    config = OrdinalScanConfig(
+        start_height=0, end_height=100, limit=3, rpc_batch_size=50
+    )
+    locations = OrdinalIndexer(BatchingRPC()).scan_range(config)
+
+    assert requested == [[0, 1, 2]]
+    assert [location.txid for location in locations] == ["tx0", "tx1", "tx2"]
+
+
+def test_rpc_batch_orders_results_and_raises_first_error() -> None:
+    class FakeResponse:
+        ok = True
+
+        def __init__(self, body: list) -> None:
+            self.body = body
+
+        def json(self) -> list:
+            return self.body
+
+    class FakeSession:
+        def __init__(self, fail_id: int | None = None) -> None:
+            self.fail_id = fail_id
+
+        def post(self, url: str, data: str, **_: object) -> FakeResponse:
+            calls = json.loads(data)
+            body = [
+                (
+                    {"id": call["id"], "error": {"code": -8, "message": "bad"}}
+                    if call["id"] == self.fail_id
+                    else {"id": call["id"], "result": call["params"][0] * 2}
+                )
+                for call in reversed(calls)
+            ]
+            return FakeResponse(body)
+
+    client = DigiByteRPCClient(RPCConfig(user="u", password="p"))
+    client._session = FakeSession()
+    assert client.batch([("m", [1]), ("m", [2]), ("m", [3])]) == [2, 4, 6]
+    assert client.batch([]) == []
+
+    client._session = FakeSession(fail_id=1)
+    with pytest.raises(RPCError):
+        client.batch([("m", [1]), ("m", [2])])
+
+
+def test_listunspent_forwards_addresses_and_query_options(monkeypatch) -> None:
+    client = DigiByteRPCClient(RPCConfig(user="u", password="p"))
+    calls: list[tuple[str, list]] = []
+
+    def fake_call(method: str, params: list | None = None) -> list:
+        calls.append((method, params))
+        return []
+
+    monkeypatch.setattr(client, "call", fake_call)
+
+    client.listunspent(1)
+    client.listunspent(0, addresses=["dgb1a"])
+    client.listunspent(0, query_options={"minimumAmount": 0.5})
+    assert [params for _, params in calls] == [
+        [1, 9999999],
+        [0, 9999999, ["dgb1a"]],
+        [0, 9999999, [], True, {"minimumAmount": 0.5}],
+    ]
@@ -17,6 +17,7 @@ from enigmatic_dgb.planner import (
     SymbolPlan,
     SymbolPlanner,
     broadcast_pattern_plan,
+    match_utxo_references,
     plan_explicit_pattern,
     plan_independent_pattern,
 )
@@ -549,3 +550,17 @@ def test_symbol_planner_chain_links_change(automation: AutomationMetadata) -> No
         assert next_inputs[0].txid == PREVIOUS_CHANGE_SENTINEL
         assert next_inputs[0].vout == 1
         assert chain.transactions[idx].change_output is not None
+
+
+def test_match_utxo_references_keeps_request_order() -> None:
+    available = [
+        {"txid": "a", "vout": 0, "amount": 1},
+        {"txid": "a", "vout": "1", "amount": 2},
+        {"txid": "b", "vout": 0, "amount": 3, "spendable": False},
+        {"txid": "c", "vout": 0, "amount": 4},
+    ]
+    selected, missing = match_utxo_references(
+        available, [("c", 0), ("a", 1), ("b", 0), ("a", 2)]
+    )
+    assert [entry["amount"] for entry in selected] == [4, 2]
+    assert missing == [("b", 0), ("a", 2)]
@@ -2,6 +2,8 @@ import hashlib
 from types import SimpleNamespace
 from unittest.mock import MagicMock
 
+import pytest
+
 from enigmatic_dgb.model import EncodingConfig
 from enigmatic_dgb.watcher import Watcher
 
@@ -135,3 +137,21 @@ def test_fetch_different_address_not_picked_up() -> None:
     assert len(txs) == 0
     # getrawtransaction should NOT be called — address was present but wrong.
     rpc.getrawtransaction.assert_not_called()
+
+
+def test_run_forever_calls_after_poll_once_per_cycle(monkeypatch) -> None:
+    """The after_poll hook fires after each cycle's messages are emitted."""
+    w = _watcher_for_tests()
+    monkeypatch.setattr(w, "poll_once", lambda: ["m1", "m2"])
+    events: list[str] = []
+
+    class StopLoop(Exception):
+        pass
+
+    def fake_sleep(_seconds: float) -> None:
+        raise StopLoop
+
+    monkeypatch.setattr("enigmatic_dgb.watcher.time.sleep", fake_sleep)
+    with pytest.raises(StopLoop):
+        w.run_forever(events.append, after_poll=lambda: events.append("flush"))
+    assert events == ["m1", "m2", "flush"]